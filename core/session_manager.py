@@ -7,14 +7,39 @@ import os
 import datetime
 import shutil
 import logging
+import tempfile
 from typing import List, Dict, Any, Optional
 
+# orjson is optional; it reads and writes session files faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json_file(path: str) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    with open(path, 'rb') as f:
+        content = f.read()
+    return orjson.loads(content) if orjson else json.loads(content)
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialise data to compact UTF-8 JSON, using orjson when it is installed.
+    Only for internal files such as the Available index; session files keep the
+    json.dump formatting they have always been written with.
+    """
+    if orjson:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
 class SessionManager:
     """Manages telescope observation sessions."""
     
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self.sessions_dir = "Sessions"
+        # Kept outside Sessions/Available so directory scans for *.json never pick it up
+        self.available_index_path = os.path.join(self.sessions_dir, "available_index.json")
         self.ensure_directories()
         
     def ensure_directories(self):
@@ -33,12 +58,17 @@ class SessionManager:
                 os.makedirs(directory)
                 self.logger.info(f"Created directory: {directory}")
                 
+    @staticmethod
+    def sanitize_session_name(session_name: str) -> str:
+        """Return the filesystem-safe form of a session name used in session filenames."""
+        session_name = session_name.replace(" ", "_")
+        # Remove any invalid filename characters
+        return "".join(c for c in session_name if c.isalnum() or c in "._-")
+        
     def generate_session_filename(self, session_data: Dict[str, Any]) -> str:
         """Generate a filename for the session using timestamp and session name."""
         # Use session_name as part of the filename, sanitized for filesystem
-        session_name = session_data.get("session_name", "Unknown").replace(" ", "_")
-        # Remove any invalid filename characters
-        session_name = "".join(c for c in session_name if c.isalnum() or c in "._-")
+        session_name = self.sanitize_session_name(session_data.get("session_name", "Unknown"))
         
         # Add timestamp to prevent collisions
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -49,13 +79,12 @@ class SessionManager:
         """
         Load session data and return (data, filename).
         """
-        for filename in os.listdir(directory):
-            if filename.endswith('.json'):
-                filepath = os.path.join(directory, filename)
-                with open(filepath, 'r') as f:
-                    data = json.load(f)
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith('.json') and entry.is_file():
+                    data = load_json_file(entry.path)
                     if data.get('session_name') == session_name:
-                        return data, filepath
+                        return data, entry.path
         return None, None
 
     def save_session(self, session_data: dict, filename: str = None, status: str = "Available") -> str:
@@ -126,16 +155,18 @@ class SessionManager:
                     self.logger.warning(f"Session file not found: {filename}")
                     return None
                     
-            with open(filepath, 'r') as f:
-                session_data = json.load(f)
-                
-            self.logger.info(f"Session loaded: {filepath}")
-            return session_data
+            return self.load_session_from_path(filepath)
             
         except Exception as e:
             self.logger.error(f"Failed to load session: {e}")
             raise
             
+    def load_session_from_path(self, filepath: str) -> Dict[str, Any]:
+        """Load a session from a known file path, without searching the session directories."""
+        session_data = load_json_file(filepath)
+        self.logger.info(f"Session loaded: {filepath}")
+        return session_data
+            
     def get_available_sessions(self) -> List[str]:
         """Get list of available session files."""
         try:
@@ -154,6 +185,30 @@ class SessionManager:
             self.logger.error(f"Failed to get available sessions: {e}")
             return []
             
+    def load_available_index(self) -> Dict[str, Any]:
+        """Load the Available session index (filename -> [mtime_ns, size, session_name])."""
+        try:
+            return load_json_file(self.available_index_path)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Failed to load session index: {e}")
+            return {}
+            
+    def save_available_index(self, index: Dict[str, Any]):
+        """Atomically write the Available session index."""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.sessions_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(dumps_json(index))
+                os.replace(tmp_path, self.available_index_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except Exception as e:
+            self.logger.error(f"Failed to save session index: {e}")
+            
     def get_scheduled_sessions(self) -> List[Dict[str, Any]]:
         """Get list of scheduled sessions from ToDo directory."""
         try:
@@ -163,11 +218,12 @@ class SessionManager:
             if not os.path.exists(directory):
                 return sessions
                 
-            for filename in os.listdir(directory):
-                if filename.endswith('.json'):
-                    session_data = self.load_session(filename, directory)
-                    if session_data:
-                        sessions.append(session_data)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        session_data = self.load_session_from_path(entry.path)
+                        if session_data:
+                            sessions.append(session_data)
                         
             # Sort by start time
             sessions.sort(key=lambda x: x.get("start_time", ""))
@@ -247,25 +303,25 @@ class SessionManager:
             self.logger.error(f"Failed to delete session: {e}")
             return False
             
-    def duplicate_session(self, source_filename: str, new_name: str) -> bool:
-        """Duplicate a session with a new name."""
+    def duplicate_session(self, source_filename: str, new_name: str) -> Optional[str]:
+        """Duplicate a session with a new name and return the new file's path (None on failure)."""
         try:
             session_data = self.load_session(source_filename)
             if not session_data:
-                return False
+                return None
                 
             # Update session data for duplicate
             session_data["session_name"] = new_name
             session_data["created_date"] = datetime.datetime.now().isoformat()
             
             # Save as new session
-            self.save_session(session_data)
+            filepath = self.save_session(session_data)
             self.logger.info(f"Session duplicated: {source_filename} -> {new_name}")
-            return True
+            return filepath
             
         except Exception as e:
             self.logger.error(f"Failed to duplicate session: {e}")
-            return False
+            return None
             
     def add_to_schedule(self, session_data: Dict[str, Any]) -> bool:
         """Add a session to the schedule (ToDo directory)."""
@@ -295,11 +351,12 @@ class SessionManager:
                 return []
                 
             sessions = []
-            for filename in os.listdir(directory):
-                if filename.endswith('.json'):
-                    session_data = self.load_session(filename, directory)
-                    if session_data:
-                        sessions.append(session_data)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        session_data = self.load_session_from_path(entry.path)
+                        if session_data:
+                            sessions.append(session_data)
                         
             return sessions
             
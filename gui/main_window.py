@@ -222,6 +222,10 @@ class MainWindow:
                     scheduler.dwarf_controller.cleanup()
                 if hasattr(scheduler, 'stop'):
                     scheduler.stop()
+            if hasattr(self, 'schedule_tab'):
+                self.schedule_tab.cleanup()
+            if hasattr(self, 'sessions_tab'):
+                self.sessions_tab.cleanup()
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
         
@@ -6,14 +6,98 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
 import os
-import datetime
-import threading  # Ensure threading is imported at the top of the file
+import time
+import collections
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from core.scheduler import Scheduler
 from core.session_manager import SessionManager
+from gui.ui_dispatcher import UIDispatcher
 
 class ScheduleTab:
     """Tab for scheduling telescope sessions."""
     
+    # Scheduler event type -> (log level, indicator, indicator tag, label before the message)
+    _EVENT_FORMATS = {
+        "start": ("INFO", "[START]", "START_TAG", " Scheduler started: "),
+        "stop": ("INFO", "[STOP]", "STOP_TAG", " Scheduler stopped: "),
+        "session_start": ("INFO", "[SESSION]", "SESSION_TAG", " Session started: "),
+        "session_complete": ("SUCCESS", "[COMPLETE]", "COMPLETE_TAG", " Session completed: "),
+        "session_error": ("ERROR", "[ERROR]", "ERROR_TAG", " Session error: "),
+        "warning": ("WARNING", "[WARNING]", "WARNING_TAG", " Warning: "),
+        "info": ("INFO", "[INFO]", "INFO_TAG", " "),
+    }
+    
+    # Frame progress message logged while a session is capturing
+    _PROGRESS_FMT = "{} - Capturing frame {}/{}"
+    
+    # Log level ordering used by the level filter (unknown levels rank as INFO)
+    _LEVEL_HIERARCHY = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
+    
+    # Log text widget appearance
+    _LOG_TEXT_OPTIONS = {
+        "height": 12,
+        "wrap": tk.WORD,
+        "font": ('DejaVu Sans Mono', 10),
+        "bg": '#ffffff',
+        "fg": '#000000',
+        "insertbackground": 'black',
+    }
+    
+    # Log text tag -> foreground colour, for log levels and event indicators
+    _LOG_TAG_COLORS = {
+        "DEBUG": "#666666",
+        "INFO": "#000000",
+        "WARNING": "#cc6600",
+        "ERROR": "#cc0000",
+        "SUCCESS": "#006600",
+        "START_TAG": "#008844",
+        "STOP_TAG": "#cc3333",
+        "SESSION_TAG": "#0066cc",
+        "COMPLETE_TAG": "#006600",
+        "ERROR_TAG": "#cc0000",
+        "WARNING_TAG": "#cc6600",
+        "INFO_TAG": "#0088cc",
+    }
+    
+    # Lines kept in the session log; messages queued before it exists are capped the same way
+    _LOG_MAX_LINES = 1000
+    
+    # Above this many sessions the schedule tree only holds the rows in view
+    _VIRTUAL_THRESHOLD = 200
+    
+    # Session status -> schedule tree row tags
+    _STATUS_TAGS = {
+        "Running": ("running",),
+        "Done": ("completed",),
+        "Failed": ("failed",),
+    }
+    
+    # Execution status line shown in the details panel for each display status
+    _EXECUTION_STATUS = {
+        "Queued": "✓ Ready for execution when scheduled time arrives",
+        "Running": "✓ Currently executing",
+        "Completed": "✓ Execution completed successfully",
+        "Failed": "✗ Execution failed - needs to be reset to Available",
+    }
+    
+    _DETAILS_TEMPLATE = """Selected Session Details:
+
+Start Time: {}
+Target: {}
+Status: {}
+Frame Count: {}
+Exposure: {}
+
+Execution Status:
+{}
+
+Notes:
+- Only sessions with 'Queued' status can be executed by the scheduler
+- To re-run a Failed/Completed session, move it back to Available first
+- Running sessions cannot be modified until completion
+"""
+    
     def __init__(self, parent, config_manager):
         self.parent = parent
         self.config_manager = config_manager
@@ -26,6 +110,46 @@ class ScheduleTab:
         # Control flag for periodic updates
         self.periodic_updates_active = True
         
+        # Tree item currently shown in the details panel
+        self._last_selected_iid = None
+        # Selected row, tracked apart from the tree because windowing deletes the rows
+        # that scroll out of view and the tree's selection with them
+        self._selected_iid = None
+        
+        # Log timestamp cache - messages within the same second reuse the string
+        self._ts_cache_sec = 0
+        self._ts_cache_str = ""
+        
+        # Messages, each a tuple of (text, tag, text, tag, ...) chunks, waiting for the next
+        # batched flush; bounded because nothing is flushed until the log is first shown
+        self._log_pending = collections.deque(maxlen=self._LOG_MAX_LINES)
+        self._log_flush_id = None
+        
+        # Cached log filter settings, kept in sync by variable traces once the log exists
+        self._current_level_num = self._LEVEL_HIERARCHY["INFO"]
+        self._auto_scroll = True
+        
+        # Last (session, frames) progress logged, to drop repeated updates
+        self._last_progress = None
+        
+        # Display rows for every session and the first row of the view window
+        self._all_sessions = []
+        self._view_top = 0
+        
+        # Session identity -> tree iid, so a selected row keeps following its session
+        # when a refresh shifts the rows
+        self._row_iids = {}
+        self._next_row_iid = 0
+        
+        # Worker pool for session file I/O so disk access never blocks the Tk event loop
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ScheduleIO")
+        # True while a Remove from Queue move is in flight
+        self._remove_busy = False
+        
+        # Worker and scheduler threads never call Tk; they post callbacks here to run on
+        # the Tk thread
+        self._ui = UIDispatcher(self.parent)
+        
         # Set up scheduler callbacks for real-time log updates
         self.scheduler.set_status_callback(self.on_scheduler_status_update)
         self.scheduler.set_session_callback(self.on_scheduler_session_update)
@@ -41,6 +165,15 @@ class ScheduleTab:
         """Create and layout widgets for the schedule tab."""
         self.frame = ttk.Frame(self.parent)
         
+        self._create_top()
+        
+        # The log section is only built once the tab is first shown;
+        # messages logged before then are queued and flushed on creation
+        self.add_log_message("INFO", "Session log initialized - Ready for scheduling operations")
+        self.frame.bind("<Map>", self._ensure_log_created)
+        
+    def _create_top(self):
+        """Create the schedule queue and session details panels."""
         # Configure custom button styles
         style = ttk.Style()
         style.configure("Connected.TButton", foreground="green")
@@ -108,6 +241,11 @@ class ScheduleTab:
             width=10
         )
         self.connection_button.grid(row=0, column=3, padx=2, pady=2, sticky=tk.EW)
+        
+        # Inline status line for routine confirmations (errors still use dialogs)
+        self.status_var = tk.StringVar()
+        self._status_clear_id = None
+        ttk.Label(controls_frame, textvariable=self.status_var).pack(side=tk.RIGHT)
                 
         # Schedule tree
         self.create_schedule_tree(left_frame)
@@ -118,11 +256,21 @@ class ScheduleTab:
         
         self.create_session_details(right_frame)
         
-        # Bottom section - Session log output (40% of total height)
-        log_frame = ttk.LabelFrame(main_paned, text="Session Log Output", padding=10)
-        main_paned.add(log_frame, weight=2)  # 40% of total height
+        # Bottom section - Session log output (40% of total height), filled in by _create_log
+        self._log_frame = ttk.LabelFrame(main_paned, text="Session Log Output", padding=10)
+        main_paned.add(self._log_frame, weight=2)  # 40% of total height
+        
+    def _create_log(self):
+        """Create the session log section and flush any messages queued before it existed."""
+        self.create_log_output(self._log_frame)
+        self._flush_log()
         
-        self.create_log_output(log_frame)
+    def _ensure_log_created(self, event=None):
+        """Build the log section the first time the tab is mapped."""
+        if hasattr(self, 'log_text'):
+            return
+        self.frame.unbind("<Map>")
+        self._create_log()
         
     def create_schedule_tree(self, parent):
         """Create the schedule queue tree view."""
@@ -147,14 +295,19 @@ class ScheduleTab:
         self.schedule_tree.column("frames", width=60, minwidth=50)
         self.schedule_tree.column("exposure", width=70, minwidth=60)
         
-        # Scrollbars
-        tree_scroll_y = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self.schedule_tree.yview)
+        # Configure tags for visual styling
+        self.schedule_tree.tag_configure("running", background="#e6f3ff", foreground="#0066cc")
+        self.schedule_tree.tag_configure("completed", background="#e6ffe6", foreground="#006600")
+        self.schedule_tree.tag_configure("failed", background="#ffe6e6", foreground="#cc0000")
+        
+        # Scrollbars - vertical scrolling goes through the view window handlers
+        self._tree_scroll_y = ttk.Scrollbar(tree_container, orient=tk.VERTICAL, command=self._on_tree_yview)
         tree_scroll_x = ttk.Scrollbar(tree_container, orient=tk.HORIZONTAL, command=self.schedule_tree.xview)
-        self.schedule_tree.configure(yscrollcommand=tree_scroll_y.set, xscrollcommand=tree_scroll_x.set)
+        self.schedule_tree.configure(yscrollcommand=self._on_tree_yscroll, xscrollcommand=tree_scroll_x.set)
         
         # Grid layout for better control
         self.schedule_tree.grid(row=0, column=0, sticky=tk.N+tk.S+tk.E+tk.W)
-        tree_scroll_y.grid(row=0, column=1, sticky=tk.N+tk.S)
+        self._tree_scroll_y.grid(row=0, column=1, sticky=tk.N+tk.S)
         tree_scroll_x.grid(row=1, column=0, sticky=tk.E+tk.W)
         
         # Configure grid weights
@@ -163,6 +316,12 @@ class ScheduleTab:
         
         # Bind events
         self.schedule_tree.bind("<<TreeviewSelect>>", self.on_schedule_select)
+        self.schedule_tree.bind("<Configure>", self._on_tree_configure)
+        self.schedule_tree.bind("<MouseWheel>", self._on_tree_wheel)
+        self.schedule_tree.bind("<Button-4>", self._on_tree_wheel)
+        self.schedule_tree.bind("<Button-5>", self._on_tree_wheel)
+        for key in ("<Up>", "<Down>", "<Prior>", "<Next>", "<Home>", "<End>"):
+            self.schedule_tree.bind(key, self._on_tree_key)
         
     def create_session_details(self, parent):
         """Create session details panel."""
@@ -178,12 +337,14 @@ class ScheduleTab:
         button_grid = ttk.Frame(button_frame)
         button_grid.pack(fill=tk.X)
         
-        ttk.Button(
+        # Kept so it can be disabled while a removal runs on the I/O pool
+        self._remove_button = ttk.Button(
             button_grid, 
             text="Remove from Queue", 
             command=self.remove_from_queue,
             width=18
-        ).grid(row=0, column=0, padx=(0, 5), pady=(0, 5), sticky=tk.W+tk.E)
+        )
+        self._remove_button.grid(row=0, column=0, padx=(0, 5), pady=(0, 5), sticky=tk.W+tk.E)
         
         ttk.Button(
             button_grid, 
@@ -233,6 +394,7 @@ class ScheduleTab:
         
         # Auto-scroll checkbox
         self.auto_scroll_var = tk.BooleanVar(value=True)
+        self.auto_scroll_var.trace_add("write", self._on_auto_scroll_change)
         ttk.Checkbutton(
             log_controls,
             text="Auto-scroll",
@@ -242,6 +404,7 @@ class ScheduleTab:
         # Log level filter
         ttk.Label(log_controls, text="Level:").pack(side=tk.LEFT, padx=(20, 5))
         self.log_level_var = tk.StringVar(value="INFO")
+        self.log_level_var.trace_add("write", self._on_level_change)
         log_level_combo = ttk.Combobox(
             log_controls,
             textvariable=self.log_level_var,
@@ -268,56 +431,38 @@ class ScheduleTab:
         log_text_frame = ttk.Frame(parent)
         log_text_frame.pack(fill=tk.BOTH, expand=True)
         
-        self.log_text = tk.Text(
-            log_text_frame, 
-            height=12, 
-            wrap=tk.WORD,
-            font=('DejaVu Sans Mono', 10),
-            bg='#ffffff',
-            fg='#000000',
-            insertbackground='black'
-        )
+        self.log_text = tk.Text(log_text_frame, **self._LOG_TEXT_OPTIONS)
         
-        log_scroll_y = ttk.Scrollbar(log_text_frame, orient=tk.VERTICAL, command=self.log_text.yview)
+        self._log_scroll_y = ttk.Scrollbar(log_text_frame, orient=tk.VERTICAL, command=self.log_text.yview)
         log_scroll_x = ttk.Scrollbar(log_text_frame, orient=tk.HORIZONTAL, command=self.log_text.xview)
-        self.log_text.configure(yscrollcommand=log_scroll_y.set, xscrollcommand=log_scroll_x.set)
+        self.log_text.configure(yscrollcommand=self._log_scroll_y.set, xscrollcommand=log_scroll_x.set)
         
         # Pack scrollbars first, then text widget - this ensures proper layout
-        log_scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self._log_scroll_y.pack(side=tk.RIGHT, fill=tk.Y)
         log_scroll_x.pack(side=tk.BOTTOM, fill=tk.X)
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Configure text tags for different log levels
-        self.log_text.tag_config("DEBUG", foreground="#666666")
-        self.log_text.tag_config("INFO", foreground="#000000")
-        self.log_text.tag_config("WARNING", foreground="#cc6600")
-        self.log_text.tag_config("ERROR", foreground="#cc0000")
-        self.log_text.tag_config("SUCCESS", foreground="#006600")
-        
-        # Configure text tags for indicator types
-        self.log_text.tag_config("START_TAG", foreground="#008844")
-        self.log_text.tag_config("STOP_TAG", foreground="#cc3333")
-        self.log_text.tag_config("SESSION_TAG", foreground="#0066cc")
-        self.log_text.tag_config("COMPLETE_TAG", foreground="#006600")
-        self.log_text.tag_config("ERROR_TAG", foreground="#cc0000")
-        self.log_text.tag_config("WARNING_TAG", foreground="#cc6600")
-        self.log_text.tag_config("INFO_TAG", foreground="#0088cc")
-        
-        # Add initial welcome message
-        self.add_log_message("INFO", "Session log initialized - Ready for scheduling operations")
+        # Configure text tags for log levels and indicator types
+        for tag, foreground in self._LOG_TAG_COLORS.items():
+            self.log_text.tag_config(tag, foreground=foreground)
+        
+    def _on_level_change(self, *args):
+        """Cache the numeric log level whenever the level filter changes."""
+        self._current_level_num = self._LEVEL_HIERARCHY.get(self.log_level_var.get(), 1)
+        
+    def _on_auto_scroll_change(self, *args):
+        """Cache the auto-scroll setting so log flushes avoid a Tcl variable read."""
+        self._auto_scroll = self.auto_scroll_var.get()
         
     def clear_log(self):
         """Clear the log output."""
         if hasattr(self, 'log_text'):
+            self._log_pending.clear()
             self.log_text.delete(1.0, tk.END)
             self.add_log_message("INFO", "Log cleared")
         
     def refresh_schedule(self):
         """Refresh the schedule display."""
-        # Clear current items
-        for item in self.schedule_tree.get_children():
-            self.schedule_tree.delete(item)
-            
         # Get sessions from all status directories
         all_sessions = []
         
@@ -348,11 +493,11 @@ class ScheduleTab:
         # Sort all sessions by start time
         all_sessions.sort(key=lambda x: x.get("start_time", ""))
         
-        # Add sessions to tree with appropriate formatting
+        # Build display rows; the tree is populated from these by _update_window
+        rows = []
+        row_iids = {}
+        occurrences = {}
         for session in all_sessions:
-            status = session["current_status"]
-            display_status = session["display_status"]
-            
             # Create display values
             start_time = session.get("start_time", "")
             target_name = session.get("target_name", "")
@@ -362,87 +507,217 @@ class ScheduleTab:
             # Format exposure time
             exposure_display = f"{exposure_time}s" if exposure_time else ""
             
-            # Insert item with status-based formatting
-            item_id = self.schedule_tree.insert("", tk.END, values=(
-                start_time,
-                target_name,
-                display_status,
-                frame_count,
-                exposure_display
-            ))
-            
-            # Apply different styling based on status
-            if status == "ToDo":
-                # Queued sessions - normal appearance (can be executed)
-                self.schedule_tree.set(item_id, "status", "Queued")
-            elif status == "Running":
-                # Running sessions - highlight in blue
-                self.schedule_tree.item(item_id, tags=("running",))
-            elif status == "Done":
-                # Completed sessions - highlight in green
-                self.schedule_tree.item(item_id, tags=("completed",))
-            elif status == "Failed":
-                # Failed sessions - highlight in red
-                self.schedule_tree.item(item_id, tags=("failed",))
-        
-        # Configure tags for visual styling
-        self.schedule_tree.tag_configure("running", background="#e6f3ff", foreground="#0066cc")
-        self.schedule_tree.tag_configure("completed", background="#e6ffe6", foreground="#006600")
-        self.schedule_tree.tag_configure("failed", background="#ffe6e6", foreground="#cc0000")
+            values = (start_time, target_name, session["display_status"], frame_count, exposure_display)
+            
+            # Duplicated sessions share a session_id, so repeats are told apart by count
+            identity = session.get("session_id") or (session.get("session_name", ""), start_time, target_name)
+            occurrence = occurrences.get(identity, 0)
+            occurrences[identity] = occurrence + 1
+            key = (identity, occurrence)
+            iid = self._row_iids.get(key)
+            if iid is None:
+                iid = f"s{self._next_row_iid}"
+                self._next_row_iid += 1
+            row_iids[key] = iid
+            
+            rows.append((iid, values, self._STATUS_TAGS.get(session["current_status"], ())))
+            
+        self._row_iids = row_iids
+        self._all_sessions = rows
+        self._update_window()
+        self._resync_details()
+        
+    def _resync_details(self):
+        """Redraw the details for the selected session after a refresh, or clear them if it is gone."""
+        self._last_selected_iid = None
+        values = self._selected_values()
+        if values:
+            self._show_details(self._selected_iid, values)
+        else:
+            self._selected_iid = None
+            self.details_text.delete("1.0", tk.END)
+            
+    def _selected_values(self):
+        """Return the display values of the selected session, or None if nothing is selected."""
+        if self._selected_iid is None:
+            return None
+        for iid, values, _tags in self._all_sessions:
+            if iid == self._selected_iid:
+                return values
+        return None
+        
+    def _is_windowed(self):
+        """Return True when the tree only holds the rows inside the view window."""
+        return len(self._all_sessions) > self._VIRTUAL_THRESHOLD
+        
+    def _visible_row_count(self):
+        """Estimate how many rows fit in the schedule tree."""
+        rowheight = ttk.Style().lookup("Treeview", "rowheight")
+        try:
+            rowheight = int(rowheight) or 20
+        except (TypeError, ValueError):
+            rowheight = 20
+        # One row's worth of height is taken by the column headings
+        fitting = self.schedule_tree.winfo_height() // rowheight - 1
+        return max(int(self.schedule_tree.cget("height")), fitting)
+        
+    def _update_window(self):
+        """Populate the tree with the rows inside the current view window."""
+        total = len(self._all_sessions)
+        if self._is_windowed():
+            count = self._visible_row_count()
+            self._view_top = max(0, min(self._view_top, total - count))
+            first = self._view_top
+        else:
+            count = total
+            first = self._view_top = 0
+        last = min(total, first + count)
+        
+        # Drop rows that left the window, then update or insert rows in order
+        rows = self._all_sessions[first:last]
+        order = tuple(iid for iid, _, _ in rows)
+        wanted = set(order)
+        stale = [iid for iid in self.schedule_tree.get_children() if iid not in wanted]
+        if stale:
+            self.schedule_tree.delete(*stale)
+            
+        for position, (iid, values, tags) in enumerate(rows):
+            if self.schedule_tree.exists(iid):
+                self.schedule_tree.item(iid, values=values, tags=tags)
+            else:
+                self.schedule_tree.insert("", position, iid=iid, values=values, tags=tags)
+                
+        # Reused rows keep their old place, so reorder in one call when sessions moved
+        if self.schedule_tree.get_children() != order:
+            self.schedule_tree.set_children("", *order)
+            
+        # Restore the selection when the selected row comes back into the window
+        if self._selected_iid in wanted and self.schedule_tree.selection() != (self._selected_iid,):
+            self.schedule_tree.selection_set(self._selected_iid)
+            self.schedule_tree.focus(self._selected_iid)
+            
+        if self._is_windowed():
+            # The window itself is the scroll position, so keep the tree at its top
+            self.schedule_tree.yview_moveto(0)
+            self._on_tree_yscroll(0, 1)
+            
+    def _on_tree_configure(self, event):
+        """Resize the view window when the tree's height changes."""
+        if self._is_windowed():
+            self._update_window()
+            
+    def _on_tree_yview(self, *args):
+        """Scrollbar command: scroll the tree, or move the view window when windowed."""
+        if not self._is_windowed():
+            self.schedule_tree.yview(*args)
+            return
+            
+        total = len(self._all_sessions)
+        if args[0] == "moveto":
+            self._view_top = int(float(args[1]) * total)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_row_count()
+            self._view_top += step
+        self._update_window()
+        
+    def _on_tree_yscroll(self, first, last):
+        """Tree yscrollcommand: report the view window position against all rows."""
+        if not self._is_windowed():
+            self._tree_scroll_y.set(first, last)
+            return
+            
+        total = len(self._all_sessions)
+        count = self._visible_row_count()
+        self._tree_scroll_y.set(self._view_top / total, min(1.0, (self._view_top + count) / total))
+        
+    def _on_tree_wheel(self, event):
+        """Scroll the view window with the mouse wheel when windowed."""
+        if not self._is_windowed():
+            return None
+            
+        step = -3 if (event.num == 4 or event.delta > 0) else 3
+        self._view_top += step
+        self._update_window()
+        return "break"
+            
+    def _on_tree_key(self, event):
+        """Move the selection with Up/Down/Prior/Next/Home/End, scrolling the view window, when windowed."""
+        if not self._is_windowed():
+            return None
+            
+        total = len(self._all_sessions)
+        count = self._visible_row_count()
+        current = self._view_top
+        for index, (iid, _values, _tags) in enumerate(self._all_sessions):
+            if iid == self._selected_iid:
+                current = index
+                break
+                
+        steps = {"Up": -1, "Down": 1, "Prior": -count, "Next": count}
+        if event.keysym == "Home":
+            target = 0
+        elif event.keysym == "End":
+            target = total - 1
+        else:
+            target = max(0, min(total - 1, current + steps[event.keysym]))
+            
+        # Pages move the window with the selection; other keys scroll just enough to show it
+        if event.keysym in ("Prior", "Next"):
+            self._view_top += target - current
+        if target < self._view_top:
+            self._view_top = target
+        elif target >= self._view_top + count:
+            self._view_top = target - count + 1
+            
+        self._selected_iid = self._all_sessions[target][0]
+        self._update_window()
+        return "break"
             
     def on_schedule_select(self, event):
         """Handle schedule tree selection."""
         selection = self.schedule_tree.selection()
         if not selection:
+            # An empty selection with the row still in the tree is the user deselecting;
+            # otherwise the row was scrolled out of the window and stays selected
+            if self._selected_iid is not None and self.schedule_tree.exists(self._selected_iid):
+                self._selected_iid = None
             return
             
-        item = self.schedule_tree.item(selection[0])
-        values = item["values"]
+        # Reselecting the row already on display needs no redraw
+        iid = selection[0]
+        self._selected_iid = iid
+        if iid == self._last_selected_iid:
+            return
+            
+        values = self.schedule_tree.item(iid)["values"]
         
         if values:
-            start_time = values[0]
-            target_name = values[1]
-            status = values[2]
-            frame_count = values[3]
-            exposure = values[4]
-            
-            # Determine session's current status and executability
-            execution_status = ""
-            if status == "Queued":
-                execution_status = "✓ Ready for execution when scheduled time arrives"
-            elif status == "Running":
-                execution_status = "✓ Currently executing"
-            elif status == "Completed":
-                execution_status = "✓ Execution completed successfully"
-            elif status == "Failed":
-                execution_status = "✗ Execution failed - needs to be reset to Available"
-            
-            # Display session details with status information
-            details = f"""Selected Session Details:
-
-Start Time: {start_time}
-Target: {target_name}
-Status: {status}
-Frame Count: {frame_count}
-Exposure: {exposure}
-
-Execution Status:
-{execution_status}
-
-Notes:
-- Only sessions with 'Queued' status can be executed by the scheduler
-- To re-run a Failed/Completed session, move it back to Available first
-- Running sessions cannot be modified until completion
-"""
-            self.details_text.delete(1.0, tk.END)
-            self.details_text.insert(1.0, details)
+            self._show_details(iid, values)
+            
+    def _show_details(self, iid, values):
+        """Display a session's details with status information."""
+        self._last_selected_iid = iid
+        start_time, target_name, status, frame_count, exposure = values[:5]
+        execution_status = self._EXECUTION_STATUS.get(status, "")
+        
+        details = self._DETAILS_TEMPLATE.format(
+            start_time, target_name, status, frame_count, exposure, execution_status
+        )
+        self.details_text.replace("1.0", tk.END, details)
             
     def start_scheduler(self):
         """Start the scheduling engine."""
         try:
             self.scheduler.start()
+            # Status and session callbacks arrive from the scheduler thread while it runs
+            thread = self.scheduler.scheduler_thread
+            if thread is not None:
+                self._ui.hold_while(thread.is_alive)
             self.update_scheduler_status()  # Update status display
             self.log_scheduler_event("start", "Telescope scheduling engine activated")
+            self.show_status("Scheduler started")
             self.logger.info("Scheduler started")
         except Exception as e:
             self.log_scheduler_event("session_error", f"Failed to start scheduler: {e}")
@@ -455,12 +730,25 @@ Notes:
             self.scheduler.stop()
             self.update_scheduler_status()  # Update status display
             self.log_scheduler_event("stop", "Telescope scheduling engine deactivated")
+            self.show_status("Scheduler stopped")
             self.logger.info("Scheduler stopped")
         except Exception as e:
             self.log_scheduler_event("session_error", f"Failed to stop scheduler: {e}")
             messagebox.showerror("Error", f"Failed to stop scheduler: {e}")
             self.logger.error(f"Failed to stop scheduler: {e}")
             
+    def show_status(self, message, duration_ms=3000):
+        """Show a transient message in the inline status line."""
+        if self._status_clear_id is not None:
+            self.parent.after_cancel(self._status_clear_id)
+        self.status_var.set(message)
+        self._status_clear_id = self.parent.after(duration_ms, self._clear_status)
+        
+    def _clear_status(self):
+        """Clear the inline status line."""
+        self._status_clear_id = None
+        self.status_var.set("")
+            
     def update_scheduler_status(self):
         """Update the scheduler status display."""
         try:
@@ -518,17 +806,17 @@ Notes:
                     """Handle connection cancellation."""
                     try:
                         controller.cancel_connection()  # Use proper cancel method
-                        self.frame.after(0, lambda: [
+                        self._ui.post(lambda: [
                             self.add_log_message("INFO", "Connection attempt cancelled"),
                             self.update_button_states()
                         ])
                     except Exception as e:
-                        self.frame.after(0, lambda: [
+                        self._ui.post(lambda: [
                             self.add_log_message("ERROR", f"Error cancelling connection: {e}"),
                             self.update_button_states()
                         ])
 
-                threading.Thread(target=cancel_callback, daemon=True).start()
+                self._ui.start_thread(cancel_callback)
 
             elif controller.is_connected():
                 # Disconnect
@@ -539,17 +827,17 @@ Notes:
                     """Handle disconnect completion."""
                     try:
                         controller.disconnect()
-                        self.frame.after(0, lambda: [
+                        self._ui.post(lambda: [
                             self.add_log_message("INFO", "Disconnected from telescope"),
                             self.update_button_states()
                         ])
                     except Exception as e:
-                        self.frame.after(0, lambda: [
+                        self._ui.post(lambda: [
                             self.add_log_message("ERROR", f"Error during disconnect: {e}"),
                             self.update_button_states()
                         ])
 
-                threading.Thread(target=disconnect_callback, daemon=True).start()
+                self._ui.start_thread(disconnect_callback)
 
             else:
                 # Connect
@@ -558,15 +846,14 @@ Notes:
 
                 def connect_callback(success, message):
                     """Handle connection result."""
-                    self.frame.after(0, lambda: [
+                    self._ui.post(lambda: [
                         self._handle_connection_result(success, message)
                     ])
 
-                # Use threaded connection with reasonable timeout (3 retries * ~10s each = ~30s max)
-                threading.Thread(
-                    target=lambda: controller.connect(timeout=10, callback=connect_callback),
-                    daemon=True
-                ).start()
+                # connect() runs on the controller's executor with reasonable timeout
+                # (3 retries * ~10s each = ~30s max); poll for its result until it finishes
+                future = controller.connect(timeout=10, callback=connect_callback)
+                self._ui.hold_while(lambda: not future.done())
 
         except Exception as e:
             self.add_log_message("ERROR", f"Error toggling connection: {e}")
@@ -590,14 +877,14 @@ Notes:
             
     def remove_from_queue(self):
         """Remove selected session from queue (only works for Queued sessions)."""
-        selection = self.schedule_tree.selection()
-        if not selection:
+        # A second click while the move runs would only fail on the already-moved file
+        if self._remove_busy:
+            return
+        values = self._selected_values()
+        if values is None:
             messagebox.showwarning("No Selection", "Please select a session to remove.")
             return
             
-        item = self.schedule_tree.item(selection[0])
-        values = item["values"]
-        
         if not values:
             return
             
@@ -613,32 +900,43 @@ Notes:
             return
             
         if messagebox.askyesno("Confirm", f"Remove '{target_name}' from queue and move back to Available?"):
-            try:
-                start_time = values[0]
-                
-                # Find the session file in ToDo directory
-                success = self._find_and_move_session(target_name, start_time, "ToDo", "Available")
-                
-                if success:
-                    self.refresh_schedule()
-                    self.log_scheduler_event("info", f"Session '{target_name}' removed from queue and moved to Available")
-                else:
-                    messagebox.showerror("Error", "Failed to move session back to Available folder!")
-                    
-            except Exception as e:
-                self.logger.error(f"Error removing session from queue: {e}")
-                messagebox.showerror("Error", f"Failed to remove session: {e}")
+            start_time = values[0]
+            self._remove_busy = True
+            self._remove_button.configure(state="disabled")
+            self._ui.submit(self._io_pool, self._do_remove, target_name, start_time)
+    
+    def _do_remove(self, target_name, start_time):
+        """Move a queued session back to Available (runs on the I/O worker pool)."""
+        error = None
+        try:
+            # Find the session file in ToDo directory
+            success = self._find_and_move_session(target_name, start_time, "ToDo", "Available")
+        except Exception as e:
+            self.logger.error(f"Error removing session from queue: {e}")
+            success = False
+            error = e
+        self._ui.post(self._finish_remove, success, target_name, error)
+    
+    def _finish_remove(self, success, target_name, error=None):
+        """Apply the result of a queue removal on the Tk thread."""
+        self._remove_busy = False
+        self._remove_button.configure(state="normal")
+        if success:
+            self.refresh_schedule()
+            self.log_scheduler_event("info", f"Session '{target_name}' removed from queue and moved to Available")
+            self.show_status(f"'{target_name}' moved back to Available")
+        elif error is not None:
+            messagebox.showerror("Error", f"Failed to remove session: {error}")
+        else:
+            messagebox.showerror("Error", "Failed to move session back to Available folder!")
     
     def reset_to_available(self):
         """Reset selected session to Available status (works for Done/Failed sessions)."""
-        selection = self.schedule_tree.selection()
-        if not selection:
+        values = self._selected_values()
+        if values is None:
             messagebox.showwarning("No Selection", "Please select a session to reset.")
             return
             
-        item = self.schedule_tree.item(selection[0])
-        values = item["values"]
-        
         if not values:
             return
             
@@ -674,14 +972,11 @@ Notes:
     
     def delete_session_from_schedule(self):
         """Delete selected session permanently."""
-        selection = self.schedule_tree.selection()
-        if not selection:
+        values = self._selected_values()
+        if values is None:
             messagebox.showwarning("No Selection", "Please select a session to delete.")
             return
             
-        item = self.schedule_tree.item(selection[0])
-        values = item["values"]
-        
         if not values:
             return
             
@@ -766,72 +1061,78 @@ Notes:
             self.logger.error(f"Error finding/deleting session: {e}")
             return False
         
+    def _timestamp(self):
+        """Return the current HH:MM:SS string, formatted at most once per second."""
+        t = time.time()
+        sec = int(t)
+        if sec != self._ts_cache_sec:
+            self._ts_cache_sec = sec
+            self._ts_cache_str = time.strftime("%H:%M:%S", time.localtime(t))
+        return self._ts_cache_str
+        
     def add_log_message(self, level, message):
         """Add a message to the log output with timestamp and formatting."""
-        if not hasattr(self, 'log_text'):
-            return
-            
         # Filter by log level if specified
-        level_hierarchy = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
-        current_level = self.log_level_var.get() if hasattr(self, 'log_level_var') else "INFO"
-        
-        if level_hierarchy.get(level, 1) < level_hierarchy.get(current_level, 1):
+        if self._LEVEL_HIERARCHY.get(level, 1) < self._current_level_num:
             return
             
         # Add timestamp
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
+        timestamp = self._timestamp()
         formatted_message = f"[{timestamp}] {level}: {message}\n"
         
-        # Insert message with appropriate color
-        self.log_text.insert(tk.END, formatted_message, level)
-        
-        # Auto-scroll if enabled
-        if hasattr(self, 'auto_scroll_var') and self.auto_scroll_var.get():
-            self.log_text.see(tk.END)
-            
-        # Limit log size to prevent memory issues (keep last 1000 lines)
-        lines = self.log_text.get("1.0", tk.END).split('\n')
-        if len(lines) > 1000:
-            # Remove oldest lines
-            lines_to_remove = len(lines) - 1000
-            self.log_text.delete("1.0", f"{lines_to_remove}.0")
-            
-    def add_colored_log_message(self, level, indicator, indicator_tag, message):
-        """Add a message with colored indicator to the log output."""
-        if not hasattr(self, 'log_text'):
-            return
+        # Queue message with appropriate color
+        self._queue_log_chunks(formatted_message, level)
             
+    def add_log_message_with_prefix(self, level, prefix, message, prefix_tag=None, label=" "):
+        """Add a message with a separately tagged prefix (e.g. an event indicator) to the log output."""
         # Filter by log level if specified
-        level_hierarchy = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3}
-        current_level = self.log_level_var.get() if hasattr(self, 'log_level_var') else "INFO"
-        
-        if level_hierarchy.get(level, 1) < level_hierarchy.get(current_level, 1):
+        if self._LEVEL_HIERARCHY.get(level, 1) < self._current_level_num:
             return
             
         # Add timestamp and level
-        timestamp = datetime.datetime.now().strftime("%H:%M:%S")
-        prefix = f"[{timestamp}] {level}: "
-        
-        # Insert the prefix with level color
-        self.log_text.insert(tk.END, prefix, level)
+        timestamp = self._timestamp()
+        header = f"[{timestamp}] {level}: "
+        
+        # Queue the header, tagged prefix, label and message as separate chunks
+        # so the static parts are inserted as-is rather than concatenated
+        self._queue_log_chunks(
+            header, level,
+            prefix, prefix_tag or level,
+            label, level,
+            message, level,
+            "\n", level
+        )
+            
+    def _queue_log_chunks(self, *chunks):
+        """Queue one message as alternating text/tag chunks and schedule a single flush."""
+        self._log_pending.append(chunks)
+        if self._log_flush_id is None:
+            self._log_flush_id = self.parent.after_idle(self._flush_log)
+            
+    def _flush_log(self):
+        """Insert all pending log chunks into the log widget in one batch."""
+        self._log_flush_id = None
+        if not self._log_pending or not hasattr(self, 'log_text'):
+            return
+            
+        chunks = list(itertools.chain.from_iterable(self._log_pending))
+        self._log_pending.clear()
         
-        # Insert the colored indicator
-        self.log_text.insert(tk.END, indicator, indicator_tag)
+        # Detach the scrollbar so it is reconfigured once per batch, not per insert
+        self.log_text.configure(yscrollcommand="")
+        self.log_text.insert(tk.END, *chunks)
         
-        # Insert the rest of the message with level color
-        self.log_text.insert(tk.END, f"{message}\n", level)
+        # Limit log size to prevent memory issues (keep the last _LOG_MAX_LINES lines)
+        line_count = int(self.log_text.index("end-1c").split(".")[0]) - 1
+        if line_count > self._LOG_MAX_LINES:
+            self.log_text.delete("1.0", f"{line_count - self._LOG_MAX_LINES + 1}.0")
+            
+        self.log_text.configure(yscrollcommand=self._log_scroll_y.set)
         
         # Auto-scroll if enabled
-        if hasattr(self, 'auto_scroll_var') and self.auto_scroll_var.get():
+        if self._auto_scroll:
             self.log_text.see(tk.END)
             
-        # Limit log size to prevent memory issues (keep last 1000 lines)
-        lines = self.log_text.get("1.0", tk.END).split('\n')
-        if len(lines) > 1000:
-            # Remove oldest lines
-            lines_to_remove = len(lines) - 1000
-            self.log_text.delete("1.0", f"{lines_to_remove}.0")
-            
     def save_log(self):
         """Save current log content to file."""
         if not hasattr(self, 'log_text'):
@@ -846,38 +1147,46 @@ Notes:
         )
         
         if filename:
-            try:
-                with open(filename, 'w', encoding='utf-8') as f:
-                    content = self.log_text.get("1.0", tk.END)
-                    f.write(content)
-                self.add_log_message("INFO", f"Log saved to {filename}")
-            except Exception as e:
-                self.add_log_message("ERROR", f"Failed to save log: {e}")
-                messagebox.showerror("Save Error", f"Failed to save log file:\n{e}")
+            self._flush_log()
+            
+            # Text.dump must run on the Tk thread; it yields the buffer as text
+            # segments so the worker can write them without joining one big string
+            chunks = self.log_text.dump("1.0", tk.END, text=True)
+            self.add_log_message("INFO", f"Saving log to {filename}...")
+            self._ui.submit(self._io_pool, self._write_log_file, filename, chunks)
+    
+    def _write_log_file(self, filename, chunks):
+        """Write dumped log segments to disk (runs on the I/O worker pool)."""
+        try:
+            with open(filename, 'w', encoding='utf-8') as f:
+                for _key, value, _index in chunks:
+                    f.write(value)
+            self._ui.post(self._finish_save_log, filename, None)
+        except Exception as e:
+            self._ui.post(self._finish_save_log, filename, e)
+    
+    def _finish_save_log(self, filename, error):
+        """Report the result of a log save on the Tk thread."""
+        if error is None:
+            self.add_log_message("INFO", f"Log saved to {filename}")
+        else:
+            self.add_log_message("ERROR", f"Failed to save log: {error}")
+            messagebox.showerror("Save Error", f"Failed to save log file:\n{error}")
                 
     def log_scheduler_event(self, event_type, message):
         """Log scheduler events with appropriate formatting."""
-        if event_type == "start":
-            self.add_colored_log_message("INFO", "[START]", "START_TAG", f" Scheduler started: {message}")
-        elif event_type == "stop":
-            self.add_colored_log_message("INFO", "[STOP]", "STOP_TAG", f" Scheduler stopped: {message}")
-        elif event_type == "session_start":
-            self.add_colored_log_message("INFO", "[SESSION]", "SESSION_TAG", f" Session started: {message}")
-        elif event_type == "session_complete":
-            self.add_colored_log_message("SUCCESS", "[COMPLETE]", "COMPLETE_TAG", f" Session completed: {message}")
-        elif event_type == "session_error":
-            self.add_colored_log_message("ERROR", "[ERROR]", "ERROR_TAG", f" Session error: {message}")
-        elif event_type == "warning":
-            self.add_colored_log_message("WARNING", "[WARNING]", "WARNING_TAG", f" Warning: {message}")
-        elif event_type == "info":
-            self.add_colored_log_message("INFO", "[INFO]", "INFO_TAG", f" {message}")
-        else:
+        event_format = self._EVENT_FORMATS.get(event_type)
+        if event_format is None:
             self.add_log_message("DEBUG", message)
+            return
+            
+        level, indicator, indicator_tag, label = event_format
+        self.add_log_message_with_prefix(level, indicator, message, indicator_tag, label)
             
     def on_scheduler_status_update(self, status_message):
         """Callback for scheduler status updates - thread safe."""
-        # Use after() to ensure GUI updates happen on main thread
-        self.frame.after(0, lambda: [
+        # Post so the GUI updates happen on the main thread
+        self._ui.post(lambda: [
             self.add_log_message("INFO", status_message),
             self.update_scheduler_status(),
             self.update_button_states()
@@ -889,14 +1198,24 @@ Notes:
         session_name = session_data.get("target_name", "Unknown")
         status = session_data.get("status", "Unknown")
         
-        # Use after() to ensure GUI updates happen on main thread
+        # Post so the GUI updates happen on the main thread
         def update_gui():
+            # A run starting or ending resets progress de-duplication, so a later run of the
+            # same session logs its first progress update even at the same frame count
+            if status != "capturing":
+                self._last_progress = None
+                
             if status == "starting":
                 self.log_scheduler_event("session_start", f"{session_name} - Session initialization")
             elif status == "capturing":
                 frames = session_data.get("frames_captured", 0)
                 total_frames = session_data.get("frame_count", 0)
-                self.log_scheduler_event("info", f"{session_name} - Capturing frame {frames}/{total_frames}")
+                
+                # Identical consecutive progress updates change nothing on screen
+                if (session_name, frames) == self._last_progress:
+                    return
+                self._last_progress = (session_name, frames)
+                self.log_scheduler_event("info", self._PROGRESS_FMT.format(session_name, frames, total_frames))
             elif status == "completed":
                 frames = session_data.get("frames_captured", 0)
                 duration = session_data.get("duration", "Unknown")
@@ -912,5 +1231,13 @@ Notes:
             # Refresh the schedule display to show updated status
             self.refresh_schedule()
         
-        self.frame.after(0, update_gui)
+        self._ui.post(update_gui)
+        
+    def cleanup(self):
+        """Stop posting results to Tk and shut down the I/O worker pool."""
+        self._ui.close()
+        try:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+        except Exception as e:
+            self.logger.error(f"Error shutting down schedule I/O pool: {e}")
 
@@ -5,14 +5,156 @@ Sessions tab for creating and managing telescope sessions.
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import datetime
-import json
+import functools
+import math
 import os
+import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import logging
 from typing import Dict, Any, Tuple
-from core.session_manager import SessionManager
+from core.session_manager import SessionManager, load_json_file
+from gui.ui_dispatcher import UIDispatcher
+
+# orjson is optional; it decodes Stellarium responses faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# watchdog is optional; without it the Available index falls back to directory mtime checks
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    
+    class _AvailableChangeHandler(FileSystemEventHandler):
+        """
+        Invalidate the sessions tab's Available index when the directory changes.
+        Only events that change contents count; "opened" and "closed_no_write" events
+        from the tab's own reads are ignored, so reading never forces a rescan.
+        """
+        
+        def __init__(self, tab):
+            super().__init__()
+            self.tab = tab
+            
+        def on_created(self, event):
+            self.tab._invalidate_available_index()
+            
+        def on_deleted(self, event):
+            self.tab._invalidate_available_index()
+            
+        def on_moved(self, event):
+            self.tab._invalidate_available_index()
+            
+        def on_modified(self, event):
+            self.tab._invalidate_available_index()
+            
+        def on_closed(self, event):
+            # Closed after writing; a close without writing is on_closed_no_write
+            self.tab._invalidate_available_index()
+except ImportError:
+    Observer = None
+
+log = logging.getLogger(__name__)
+
+# Timestamp helpers for new sessions; the "Session_" prefix lives in the format so
+# a default session name takes a single strftime call
+_NOW = datetime.datetime.now
+_FMT_HUMAN = "%Y-%m-%d %H:%M:%S"
+_FMT_ID = "Session_%Y%m%d_%H%M%S"
+
+# Pattern used by parse_coordinate_input, compiled once at import
+_PART_RE = re.compile(r'^-?\d+(?:\.\d*)?$')
+
+# Single-character symbol clean-ups, applied with one str.translate pass
+_SPACE_STRIP = str.maketrans('', '', '"\'°')
+_COORD_TRANS = str.maketrans({'°': ':', 'h': ':', 'm': ':', "'": ':', '"': None, 's': None})
+
+# Characters of the canonical HH:MM:SS.ss form produced by format_coordinate_display
+_FAST_CHARS = frozenset("0123456789:.-")
+
+_INV_3600 = 1.0 / 3600.0
+
+# Trailing character -> (unit suffix, whether the value is in degrees)
+_SUFFIXES = {
+    'r': ('hr', False),  # Stellarium format like "1.3297hr", already in hours
+    'd': ('d', True),
+    '°': ('°', True),
+}
+
+def _parse_suffixed(coord: str, is_ra: bool, strip_len: int, is_degrees: bool) -> float:
+    """Parse a decimal value followed by a unit suffix."""
+    value = float(coord[:-strip_len])
+    # Convert RA degrees to hours
+    if is_degrees and is_ra:
+        value = value / 15.0
+    return value
+
+def _sexagesimal_to_decimal(parts) -> float:
+    """Convert [hours/degrees, minutes, seconds] strings to a signed decimal value."""
+    # Handle negative values
+    sign = 1
+    first_part = parts[0]
+    if first_part.startswith('-'):
+        sign = -1
+        first_part = first_part[1:]
+        
+    hours_or_degrees = float(first_part)
+    minutes = float(parts[1]) if len(parts) > 1 else 0
+    seconds = float(parts[2]) if len(parts) > 2 else 0
+    
+    # Convert to decimal
+    decimal_value = hours_or_degrees + (minutes*60.0 + seconds)*_INV_3600
+    return sign * decimal_value
+
+@functools.lru_cache(maxsize=256)
+def _parse_coordinate_cached(coord: str, is_ra: bool) -> float:
+    """
+    Parse a stripped, non-empty coordinate string.
+    Cached on (coord, is_ra) since the same entry text is converted again on every FocusOut/Return.
+    """
+    # Fast path: plain decimal number (assume degrees, convert RA to hours if needed)
+    try:
+        value = float(coord)
+    except ValueError:
+        pass
+    else:
+        # For RA, if value > 24, assume it's degrees and convert to hours
+        if is_ra and value > 24:
+            value = value / 15.0
+        return value
+        
+    # Fast path: already in canonical colon-separated form
+    if coord.count(':') == 2 and all(c in _FAST_CHARS for c in coord):
+        return _sexagesimal_to_decimal(coord.split(':'))
+        
+    # Cases 1-3: Decimal with "hr", 'd' or ° suffix, dispatched on the last character
+    suffix = _SUFFIXES.get(coord[-1])
+    if suffix and coord.endswith(suffix[0]):
+        return _parse_suffixed(coord, is_ra, len(suffix[0]), suffix[1])
+        
+    # Case 4: Space-separated format like "01 19 47" or "-29 36 15"
+    # First, clean any quotes and extra symbols for space-separated detection
+    coord_for_space_check = coord.translate(_SPACE_STRIP)
+    space_parts = coord_for_space_check.split()
+    if len(space_parts) >= 2 and all(_PART_RE.match(part) for part in space_parts):
+        return _sexagesimal_to_decimal(space_parts)
+    
+    # Now clean symbols for traditional parsing
+    # Handle formats with hr, ', " symbols (like "01hr 19' 47\"")
+    coord_clean = coord.replace(' ', '').replace('hr', ':').translate(_COORD_TRANS)
+        
+    # Case 6: HH:MM:SS or DD:MM:SS format (traditional colon-separated)
+    parts = coord_clean.split(':')
+    if len(parts) >= 2:
+        return _sexagesimal_to_decimal(parts)
+        
+    # Case 7: Single value, try to parse as float
+    return float(coord_clean)
 
 def parse_coordinate_input(coordinate_str: str, coord_type: str = "ra") -> float:
     """
@@ -32,90 +174,19 @@ def parse_coordinate_input(coordinate_str: str, coord_type: str = "ra") -> float
     Returns:
         Decimal degrees as float
     """
-    if not coordinate_str or not coordinate_str.strip():
+    if not coordinate_str:
         return 0.0
         
     # Clean the input - preserve spaces initially for space-separated format detection
-    coord = coordinate_str.strip()
+    # (Entry text rarely has surrounding whitespace, so only strip when there is some)
+    coord = coordinate_str
+    if coord[0].isspace() or coord[-1].isspace():
+        coord = coord.strip()
+        if not coord:
+            return 0.0
     
     try:
-        # Case 1: Decimal with "hr" suffix (Stellarium format like "1.3297hr")
-        if coord.endswith('hr'):
-            value = float(coord[:-2])
-            return value  # Already in hours for RA
-            
-        # Case 2: Decimal with 'd' suffix (degrees)
-        if coord.endswith('d'):
-            value = float(coord[:-1])
-            # Convert RA degrees to hours
-            if coord_type == "ra":
-                value = value / 15.0
-            return value
-            
-        # Case 3: Simple decimal number with ° symbol
-        if coord.endswith('°'):
-            value = float(coord[:-1])
-            # Convert RA degrees to hours
-            if coord_type == "ra":
-                value = value / 15.0
-            return value
-            
-        # Case 4: Space-separated format like "01 19 47" or "-29 36 15"
-        # First, clean any quotes and extra symbols for space-separated detection
-        coord_for_space_check = coord.replace('"', '').replace("'", '').replace('°', '')
-        space_parts = coord_for_space_check.split()
-        if len(space_parts) >= 2 and all(part.replace('-', '').replace('.', '').isdigit() for part in space_parts):
-            # Handle negative values
-            sign = 1
-            first_part = space_parts[0]
-            if first_part.startswith('-'):
-                sign = -1
-                first_part = first_part[1:]
-                
-            hours_or_degrees = float(first_part)
-            minutes = float(space_parts[1]) if len(space_parts) > 1 else 0
-            seconds = float(space_parts[2]) if len(space_parts) > 2 else 0
-            
-            # Convert to decimal
-            decimal_value = hours_or_degrees + minutes/60.0 + seconds/3600.0
-            return sign * decimal_value
-        
-        # Case 5: Simple decimal number (assume degrees, convert RA to hours if needed)
-        if re.match(r'^-?\d+\.?\d*$', coord):
-            value = float(coord)
-            # For RA, if value > 24, assume it's degrees and convert to hours
-            if coord_type == "ra" and value > 24:
-                value = value / 15.0
-            return value
-        
-        # Now clean symbols for traditional parsing
-        coord_clean = coord.replace(' ', '')
-        
-        # Handle formats with hr, ', " symbols (like "01hr 19' 47\"")
-        coord_clean = coord_clean.replace('hr', ':').replace('°', ':').replace('h', ':').replace('m', ':')
-        coord_clean = coord_clean.replace("'", ':').replace('"', '').replace('s', '')
-            
-        # Case 6: HH:MM:SS or DD:MM:SS format (traditional colon-separated)
-        parts = coord_clean.split(':')
-        if len(parts) >= 2:
-            # Handle negative values
-            sign = 1
-            first_part = parts[0]
-            if first_part.startswith('-'):
-                sign = -1
-                first_part = first_part[1:]
-                
-            hours_or_degrees = float(first_part)
-            minutes = float(parts[1]) if len(parts) > 1 else 0
-            seconds = float(parts[2]) if len(parts) > 2 else 0
-            
-            # Convert to decimal
-            decimal_value = hours_or_degrees + minutes/60.0 + seconds/3600.0
-            return sign * decimal_value
-            
-        # Case 7: Single value, try to parse as float
-        return float(coord_clean)
-        
+        return _parse_coordinate_cached(coord, coord_type == "ra")
     except (ValueError, IndexError) as e:
         raise ValueError(f"Invalid coordinate format: '{coordinate_str}'. Use formats like 12:34:56, 01 19 47, 123.456, 1.3297hr, or 12h34m56s")
 
@@ -134,29 +205,79 @@ def format_coordinate_display(decimal_value: float, coord_type: str = "ra") -> s
         return ""
         
     # Handle negative values for declination
-    sign = ""
-    if decimal_value < 0:
-        sign = "-"
-        decimal_value = abs(decimal_value)
-        
-    # Split into components
-    whole = int(decimal_value)
-    fraction = decimal_value - whole
+    sign = "-" if decimal_value < 0 else ""
     
-    minutes_decimal = fraction * 60
-    minutes = int(minutes_decimal)
-    seconds = (minutes_decimal - minutes) * 60
+    # Split into components on an integer count of hundredths of a second
+    total_cs = int(round(abs(decimal_value) * 360000))
+    whole, remainder = divmod(total_cs, 360000)
+    minutes, centiseconds = divmod(remainder, 6000)
     
     # Format with appropriate precision
-    return f"{sign}{whole:02d}:{minutes:02d}:{seconds:05.2f}"
+    return f"{sign}{whole:02d}:{minutes:02d}:{centiseconds / 100:05.2f}"
+
+@functools.lru_cache(maxsize=256)
+def _load_session_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a session file, cached per (path, mtime_ns, size) so an unchanged file is only
+    parsed once; the size catches rewrites within the mtime resolution of coarse filesystems.
+    The returned dict is shared between callers and must not be modified.
+    """
+    return load_json_file(path)
+
+def _load_session_path(path: str) -> Dict[str, Any]:
+    """Stat a session file and load it through the parse cache."""
+    st = os.stat(path)
+    return _load_session_file(path, st.st_mtime_ns, st.st_size)
+
+def _load_session_entry(entry: os.DirEntry):
+    """Load a session file for a directory entry, or None if it cannot be read."""
+    try:
+        st = entry.stat()
+        return _load_session_file(entry.path, st.st_mtime_ns, st.st_size)
+    except Exception as e:
+        log.error(f"Failed to load session '{entry.name}': {e}")
+        return None
+
+# Tcl lambda for "apply": sets each named global variable whose value differs, so a whole
+# form is updated in one interpreter call and unchanged variables fire no traces
+_SET_CHANGED_SCRIPT = (
+    "{args} {foreach {name value} $args {if {[set ::$name] ne $value} {set ::$name $value}}}"
+)
+# Tcl lambda for "apply": returns the values of the named global variables as one list
+_GET_VALUES_SCRIPT = "{args} {lmap name $args {set ::$name}}"
 
 class SessionsTab:
     """Tab for managing telescope sessions."""
+    
+    # Editor form rows built by _build_grid:
+    # (row, column, label, variable attribute, default, width, unit label, combobox values, stretch)
+    _BASIC_FIELDS = (
+        (0, 0, "Session Name:", "session_name_var", "", 30, None, None, True),
+        (1, 0, "Target Name:", "target_name_var", "", 30, None, None, True),
+        (2, 0, "Start Time:", "start_time_var", "", 30, None, None, False),
+    )
+    _CAPTURE_FIELDS = (
+        (0, 0, "Frame Count:", "frame_count_var", "50", 10, None, None, False),
+        (0, 2, "Exposure Time:", "exposure_var", "30", 10, "seconds", None, False),
+        (1, 0, "Gain:", "gain_var", "100", 10, None, None, False),
+        (1, 2, "Binning:", "binning_var", "1x1", 8, None, ("1x1", "2x2", "3x3", "4x4"), False),
+        (2, 0, "Filter:", "filter_var", "Astro", 10, None, ("Vis", "Astro", "Dual Band"), False),
+    )
+    _CALIBRATION_FIELDS = (
+        (1, 0, "Settling Time:", "settling_time_var", "10", 10, "seconds", None, False),
+        (2, 0, "Focus Timeout:", "focus_timeout_var", "300", 10, "seconds", None, False),
+    )
+    # (label, variable attribute, default) for the calibration checkboxes on the first row
+    _CALIBRATION_CHECKS = (
+        ("Auto Focus", "auto_focus_var", True),
+        ("Plate Solving", "plate_solve_var", True),
+        ("Auto Guiding", "auto_guide_var", False),
+    )
 
     def __init__(self, parent, config_manager):
         self.parent = parent
         self.config_manager = config_manager
-        self.logger = logging.getLogger(__name__)
+        self.logger = log
 
         # --- Add this mapping for filter display names <-> values ---
         self.filter_options = {
@@ -164,14 +285,101 @@ class SessionsTab:
             "Astro": 1,
             "Dual Band": 2
         }
+        self._filter_value_to_name = {v: k for k, v in self.filter_options.items()}
         # ------------------------------------------------------------
 
         # Initialize session manager
         self.session_manager = SessionManager()
+        
+        # Available session filename -> (mtime_ns, size, session_name), so unchanged files are not re-parsed
+        self._session_name_cache = {}
+        
+        # Listbox index -> filename, and the id of the latest background session scan
+        self.session_display_map = {}
+        self._scan_generation = 0
+        
+        # (filename, session_name) rows currently shown in the listbox, and the
+        # Available directory mtime they were scanned at
+        self._listbox_items = []
+        self._last_refresh_mtime_ns = None
+        
+        # Listbox index whose session is currently loaded in the editor
+        self._last_loaded_idx = None
+        
+        # (session_name, session data, Available filename) of the session loaded from the list
+        self._current_loaded = None
+        # Form contents right after that load, to tell whether the user has edited them
+        self._loaded_form = None
+        
+        # Available session_name -> filename, rebuilt when the directory mtime changes
+        self._available_index = {}
+        self._available_files = {}
+        self._available_mtime = 0
+        self._available_changes = 0
+        self._available_observer = None
+        # Serializes rebuilds and incremental updates across the worker threads
+        self._available_lock = threading.Lock()
+        if Observer is not None:
+            try:
+                observer = Observer()
+                observer.schedule(_AvailableChangeHandler(self), "Sessions/Available", recursive=False)
+                observer.daemon = True
+                observer.start()
+                self._available_observer = observer
+            except Exception as e:
+                log.warning(f"Cannot watch Sessions/Available, using mtime checks: {e}")
+        
+        # Decimal coordinates of the session in the editor
+        self.ra_decimal = 0.0
+        self.dec_decimal = 0.0
+        
+        # Persistent HTTP session so repeated Stellarium requests reuse the connection
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+        
+        # Stellarium endpoint that answered last time, tried first on the next request
+        self._stellarium_endpoint = None
+        
+        # One long-lived Stellarium worker; a click while a request is queued is dropped.
+        # Each request is an Event the worker sets once its results have been posted
+        self._stellarium_q = queue.Queue(maxsize=1)
+        threading.Thread(target=self._stellarium_loop, daemon=True).start()
+        
+        # Pending debounced RA/DEC conversions
+        self._ra_debounce_id = None
+        self._dec_debounce_id = None
+        
+        # Pending debounced load of the selected session
+        self._select_after_id = None
+        
+        # Session file reads and writes run here so the Tk thread never waits on disk;
+        # buttons that write are disabled while one is in flight
+        self._io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="SessionsIO")
+        # Separate pool for parsing many session files at once; tasks on _io_pool wait on it,
+        # so sharing one pool could starve them
+        self._scan_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="SessionsScan")
+        self._io_buttons = []
+        self._io_busy = False
+        
+        # Worker threads never call Tk (not even after()); they post callbacks here, and it
+        # runs them on the Tk thread, polling only while background work is outstanding
+        self._ui = UIDispatcher(self.parent)
+        
+        # The open _confirm dialog, if any; the tab shows at most one at a time
+        self._confirm_dialog = None
+        
+        # Editor variable attribute name -> Tk variable, filled as the form is built
+        self._form_vars = {}
+        # (attribute names, Tcl variable names, is-boolean flags) for _get_form_values,
+        # computed once per form build instead of on every read
+        self._form_read_spec = ((), (), ())
 
         self.create_widgets()
         self.refresh_sessions()
         
+        # Warm the Available index so the first Add to Schedule does not pay for the scan
+        threading.Thread(target=self._get_available_index, daemon=True).start()
+        
     def validate_session_data(self, session_data: Dict[str, Any]) -> Tuple[bool, str]:
         """Validate session data before saving."""
         try:
@@ -243,13 +451,12 @@ class SessionsTab:
             start_time_str = session_data.get("start_time")
             if start_time_str:
                 try:
-                    import datetime
                     start_time = datetime.datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-                    current_time = datetime.datetime.now()
+                    current_time = _NOW()
                     
                     # Warn if start time is in the past (but don't fail)
                     if start_time < current_time:
-                        self.logger.warning(f"Start time {start_time_str} is in the past")
+                        log.warning(f"Start time {start_time_str} is in the past")
                         
                 except (ValueError, TypeError):
                     return False, "Invalid start time format"
@@ -257,13 +464,23 @@ class SessionsTab:
             return True, "Validation successful"
             
         except Exception as e:
-            self.logger.error(f"Error during validation: {e}")
+            log.error(f"Error during validation: {e}")
             return False, f"Validation error: {e}"
         
     def create_widgets(self):
         """Create and layout widgets for the sessions tab."""
         self.frame = ttk.Frame(self.parent)
         
+        # Inline status line for the results of background session file operations,
+        # with a button that is only shown when a message offers an action (e.g. Retry)
+        status_frame = ttk.Frame(self.frame)
+        status_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=10, pady=(0, 5))
+        self.status_var = tk.StringVar()
+        self._status_clear_id = None
+        self._status_action = ttk.Button(status_frame)
+        self._status_label = ttk.Label(status_frame, textvariable=self.status_var)
+        self._status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
         # Main container with paned window
         paned = ttk.PanedWindow(self.frame, orient=tk.HORIZONTAL)
         paned.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -274,11 +491,29 @@ class SessionsTab:
         
         self.create_session_list(left_frame)
         
-        # Right panel - Session editor
-        right_frame = ttk.LabelFrame(paned, text="Session Editor", padding=10)
-        paned.add(right_frame, weight=2)
+        # Right panel - Session editor, built the first time the tab is shown
+        self._right_frame = ttk.LabelFrame(paned, text="Session Editor", padding=10)
+        paned.add(self._right_frame, weight=2)
         
-        self.create_session_editor(right_frame)
+        self.frame.bind("<Map>", self._ensure_editor_built)
+        
+    def _ensure_editor_built(self, event=None):
+        """
+        Build the session editor form on first use.
+        When the tab is first shown only the basic section is built right away; called
+        directly, before the form is read or filled, every section is built.
+        """
+        if not hasattr(self, 'session_name_var'):
+            self.frame.unbind("<Map>")
+            self.create_session_editor(self._right_frame)
+        if event is None:
+            self._build_pending_sections()
+            
+    def _build_pending_sections(self):
+        """Build the editor sections that create_session_editor deferred."""
+        while self._pending_sections:
+            frame, build = self._pending_sections.pop(0)
+            build(frame)
         
     def create_session_list(self, parent):
         """Create the session list with controls."""
@@ -292,22 +527,26 @@ class SessionsTab:
             command=self.new_session
         ).pack(side=tk.LEFT, padx=(0, 5))
         
-        ttk.Button(
+        delete_button = ttk.Button(
             button_frame, 
             text="Delete", 
             command=self.delete_session
-        ).pack(side=tk.LEFT, padx=(0, 5))
+        )
+        delete_button.pack(side=tk.LEFT, padx=(0, 5))
+        self._io_buttons.append(delete_button)
         
-        ttk.Button(
+        duplicate_button = ttk.Button(
             button_frame, 
             text="Duplicate", 
             command=self.duplicate_session
-        ).pack(side=tk.LEFT, padx=(0, 5))
+        )
+        duplicate_button.pack(side=tk.LEFT, padx=(0, 5))
+        self._io_buttons.append(duplicate_button)
         
         ttk.Button(
             button_frame, 
             text="Refresh", 
-            command=self.refresh_sessions
+            command=lambda: self.refresh_sessions(force=True)
         ).pack(side=tk.LEFT)
         
         # Session list
@@ -359,27 +598,34 @@ class SessionsTab:
         # Target Coordinates section
         coords_frame = ttk.LabelFrame(scrollable_frame, text="Target Coordinates", padding=10)
         coords_frame.pack(fill=tk.X, padx=5, pady=(0, 10))
-        self.create_coordinates_form(coords_frame)
         
         # Capture Settings section
         capture_frame = ttk.LabelFrame(scrollable_frame, text="Capture Settings", padding=10)
         capture_frame.pack(fill=tk.X, padx=5, pady=(0, 10))
-        self.create_capture_form(capture_frame)
         
         # Calibration section
         calib_frame = ttk.LabelFrame(scrollable_frame, text="Calibration Settings", padding=10)
         calib_frame.pack(fill=tk.X, padx=5, pady=(0, 10))
-        self.create_calibration_form(calib_frame)
+        
+        # The basic section is filled in now so the tab appears quickly; the others are
+        # filled once Tk is idle, or at once by _ensure_editor_built()
+        self._pending_sections = [
+            (coords_frame, self.create_coordinates_form),
+            (capture_frame, self.create_capture_form),
+            (calib_frame, self.create_calibration_form),
+        ]
+        self.parent.after_idle(self._build_pending_sections)
         
         # Save/Load buttons
         button_frame = ttk.Frame(parent)
         button_frame.pack(fill=tk.X, pady=(10, 0))
         
-        ttk.Button(
+        save_button = ttk.Button(
             button_frame, 
             text="Save Session", 
             command=self.save_session
-        ).pack(side=tk.LEFT, padx=(0, 5))
+        )
+        save_button.pack(side=tk.LEFT, padx=(0, 5))
         
         ttk.Button(
             button_frame, 
@@ -387,39 +633,54 @@ class SessionsTab:
             command=self.load_session
         ).pack(side=tk.LEFT, padx=(0, 5))
         
-        ttk.Button(
+        schedule_button = ttk.Button(
             button_frame, 
             text="Add to Schedule", 
             command=self.add_to_schedule
-        ).pack(side=tk.RIGHT)
+        )
+        schedule_button.pack(side=tk.RIGHT)
+        self._io_buttons.extend((save_button, schedule_button))
+        if self._io_busy:
+            self._set_io_busy(True)
         
-        # Bind mousewheel to canvas for scrolling
+        # Bind mousewheel to canvas for scrolling, only while the pointer is over the editor
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
-        
+            
+        def _on_leave(event):
+            # Moving onto a form widget inside the canvas also raises <Leave>
+            widget = canvas.winfo_containing(*canvas.winfo_pointerxy())
+            if widget is None or not (widget == canvas or str(widget).startswith(f"{canvas}.")):
+                canvas.unbind_all("<MouseWheel>")
+                
+        canvas.bind("<Enter>", lambda e: canvas.bind_all("<MouseWheel>", _on_mousewheel))
+        canvas.bind("<Leave>", _on_leave)
+        
+    def _build_grid(self, parent, fields):
+        """Create the labelled entries and comboboxes described by a field spec in one pass."""
+        for row, column, label, attr, default, width, unit, values, stretch in fields:
+            ttk.Label(parent, text=label).grid(
+                row=row, column=column, sticky=tk.W, pady=2, padx=(20 if column else 0, 10)
+            )
+            var = tk.StringVar(value=default)
+            setattr(self, attr, var)
+            self._form_vars[attr] = var
+            if values is None:
+                widget = ttk.Entry(parent, textvariable=var, width=width)
+            else:
+                widget = ttk.Combobox(parent, textvariable=var, values=values, width=width)
+            widget.grid(row=row, column=column + 1, sticky=tk.W+tk.E if stretch else tk.W, pady=2)
+            if unit:
+                ttk.Label(parent, text=unit).grid(row=row, column=column + 2, sticky=tk.W, pady=2, padx=(5, 0))
+                
     def create_basic_info_form(self, parent):
         """Create basic session information form."""
-        # Session name
-        row = 0
-        ttk.Label(parent, text="Session Name:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.session_name_var = tk.StringVar()
-        ttk.Entry(parent, textvariable=self.session_name_var, width=30).grid(row=row, column=1, sticky=tk.W+tk.E, pady=2)
-        
-        # Target name
-        row += 1
-        ttk.Label(parent, text="Target Name:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.target_name_var = tk.StringVar()
-        ttk.Entry(parent, textvariable=self.target_name_var, width=30).grid(row=row, column=1, sticky=tk.W+tk.E, pady=2)
-        
-        # Start time
-        row += 1
-        ttk.Label(parent, text="Start Time:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.start_time_var = tk.StringVar(value=datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-        ttk.Entry(parent, textvariable=self.start_time_var, width=30).grid(row=row, column=1, sticky=tk.W, pady=2)
+        # Session name, target name and start time
+        self._build_grid(parent, self._BASIC_FIELDS)
+        self.start_time_var.set(_NOW().strftime(_FMT_HUMAN))
         
         # Description
-        row += 1
+        row = len(self._BASIC_FIELDS)
         ttk.Label(parent, text="Description:").grid(row=row, column=0, sticky=tk.W+tk.N, pady=2, padx=(0, 10))
         self.description_text = tk.Text(parent, height=3, width=30)
         self.description_text.grid(row=row, column=1, sticky=tk.W+tk.E, pady=2)
@@ -433,6 +694,7 @@ class SessionsTab:
         row = 0
         ttk.Label(parent, text="Right Ascension (RA):").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
         self.ra_var = tk.StringVar()
+        self._form_vars["ra_var"] = self.ra_var
         self.ra_entry = ttk.Entry(parent, textvariable=self.ra_var, width=20)
         self.ra_entry.grid(row=row, column=1, sticky=tk.W, pady=2)
         ttk.Label(parent, text="(hours").grid(row=row, column=2, sticky=tk.W, pady=2, padx=(10, 0))
@@ -445,6 +707,7 @@ class SessionsTab:
         row += 1
         ttk.Label(parent, text="Declination (DEC):").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
         self.dec_var = tk.StringVar()
+        self._form_vars["dec_var"] = self.dec_var
         self.dec_entry = ttk.Entry(parent, textvariable=self.dec_var, width=20)
         self.dec_entry.grid(row=row, column=1, sticky=tk.W, pady=2)
         ttk.Label(parent, text="(hours)").grid(row=row, column=2, sticky=tk.W, pady=2, padx=(10, 0))
@@ -469,63 +732,22 @@ class SessionsTab:
         
     def create_capture_form(self, parent):
         """Create capture settings form."""
-        # First row: Frame count and Exposure time
-        row = 0
-        ttk.Label(parent, text="Frame Count:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.frame_count_var = tk.StringVar(value="50")
-        ttk.Entry(parent, textvariable=self.frame_count_var, width=10).grid(row=row, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(parent, text="Exposure Time:").grid(row=row, column=2, sticky=tk.W, pady=2, padx=(20, 10))
-        self.exposure_var = tk.StringVar(value="30")
-        ttk.Entry(parent, textvariable=self.exposure_var, width=10).grid(row=row, column=3, sticky=tk.W, pady=2)
-        ttk.Label(parent, text="seconds").grid(row=row, column=4, sticky=tk.W, pady=2, padx=(5, 0))
-        
-        # Second row: Gain and Binning
-        row += 1
-        ttk.Label(parent, text="Gain:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.gain_var = tk.StringVar(value="100")
-        ttk.Entry(parent, textvariable=self.gain_var, width=10).grid(row=row, column=1, sticky=tk.W, pady=2)
-        
-        ttk.Label(parent, text="Binning:").grid(row=row, column=2, sticky=tk.W, pady=2, padx=(20, 10))
-        self.binning_var = tk.StringVar(value="1x1")
-        binning_combo = ttk.Combobox(parent, textvariable=self.binning_var, 
-                                   values=["1x1", "2x2", "3x3", "4x4"], width=8)
-        binning_combo.grid(row=row, column=3, sticky=tk.W, pady=2)
-        
-        # Third row: Filter
-        row += 1
-        ttk.Label(parent, text="Filter:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.filter_var = tk.StringVar(value="Astro")
-        filter_combo = ttk.Combobox(parent, textvariable=self.filter_var,
-                                  values=["Vis", "Astro", "Dual Band"], width=10)
-        filter_combo.grid(row=row, column=1, sticky=tk.W, pady=2)
+        # Frame count and exposure time, gain and binning, then filter
+        self._build_grid(parent, self._CAPTURE_FIELDS)
         
     def create_calibration_form(self, parent):
         """Create calibration settings form."""
         # First row: Checkboxes
-        row = 0
-        self.auto_focus_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(parent, text="Auto Focus", variable=self.auto_focus_var).grid(row=row, column=0, sticky=tk.W, pady=2)
-        
-        self.plate_solve_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(parent, text="Plate Solving", variable=self.plate_solve_var).grid(row=row, column=1, sticky=tk.W, pady=2, padx=(20, 0))
-        
-        self.auto_guide_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(parent, text="Auto Guiding", variable=self.auto_guide_var).grid(row=row, column=2, sticky=tk.W, pady=2, padx=(20, 0))
-        
-        # Second row: Wait times
-        row += 1
-        ttk.Label(parent, text="Settling Time:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.settling_time_var = tk.StringVar(value="10")
-        ttk.Entry(parent, textvariable=self.settling_time_var, width=10).grid(row=row, column=1, sticky=tk.W, pady=2)
-        ttk.Label(parent, text="seconds").grid(row=row, column=2, sticky=tk.W, pady=2, padx=(5, 0))
-        
-        # Third row: Focus timeout
-        row += 1
-        ttk.Label(parent, text="Focus Timeout:").grid(row=row, column=0, sticky=tk.W, pady=2, padx=(0, 10))
-        self.focus_timeout_var = tk.StringVar(value="300")
-        ttk.Entry(parent, textvariable=self.focus_timeout_var, width=10).grid(row=row, column=1, sticky=tk.W, pady=2)
-        ttk.Label(parent, text="seconds").grid(row=row, column=2, sticky=tk.W, pady=2, padx=(5, 0))
+        for column, (label, attr, default) in enumerate(self._CALIBRATION_CHECKS):
+            var = tk.BooleanVar(value=default)
+            setattr(self, attr, var)
+            self._form_vars[attr] = var
+            ttk.Checkbutton(parent, text=label, variable=var).grid(
+                row=0, column=column, sticky=tk.W, pady=2, padx=(20 if column else 0, 0)
+            )
+            
+        # Second and third rows: Wait times
+        self._build_grid(parent, self._CALIBRATION_FIELDS)
         
     def create_context_menu(self):
         """Create context menu for session list."""
@@ -545,51 +767,179 @@ class SessionsTab:
         finally:
             self.context_menu.grab_release()
             
-    def refresh_sessions(self):
+    def refresh_sessions(self, force=False):
         """
         Refresh the session list.
-        Show session names in the listbox, but keep a mapping to filenames for selection.
+        The directory is scanned on a worker thread; the listbox is filled on the Tk thread.
+        Unless forced, nothing is rescanned while the directory's mtime is unchanged
+        (an in-place edit by another program needs the Refresh button).
         """
-        self.session_listbox.delete(0, tk.END)
-        self.session_display_map = {}  # Maps listbox index to filename
-
-        directory = "Sessions/Available"
-        if not os.path.exists(directory):
+        try:
+            mtime = os.stat("Sessions/Available").st_mtime_ns
+        except OSError:
+            mtime = 0
+        if not force and mtime == self._last_refresh_mtime_ns:
             return
+        
+        self._scan_generation += 1
+        self._ui.start_thread(self._scan_sessions, self._scan_generation, mtime)
+        
+    def _scan_sessions(self, generation, dir_mtime):
+        """
+        Read (filename, session_name) pairs from the Available directory (worker thread).
+        dir_mtime is the directory mtime seen by refresh_sessions; it is passed on as None
+        if the scan failed, so the next refresh scans again.
+        """
+        results = []
+        name_cache = {}
+        directory = "Sessions/Available"
+        previous = self._session_name_cache
 
         try:
-            files = [f for f in os.listdir(directory) if f.endswith('.json')]
-            files.sort()
-            for idx, filename in enumerate(files):
-                filepath = os.path.join(directory, filename)
-                try:
-                    with open(filepath, 'r') as f:
-                        data = json.load(f)
-                    session_name = data.get("session_name", filename[:-5])
-                except Exception as e:
-                    self.logger.error(f"Failed to load session '{filename}': {e}")
-                    session_name = filename[:-5]
-                self.session_listbox.insert(tk.END, session_name)
-                self.session_display_map[idx] = filename
+            if not previous:
+                # First scan since startup: seed the name cache from the on-disk index
+                previous = {
+                    filename: tuple(entry)
+                    for filename, entry in self.session_manager.load_available_index().items()
+                }
+                
+            if os.path.exists(directory):
+                with os.scandir(directory) as it:
+                    entries = sorted(
+                        (e for e in it if e.is_file() and e.name.endswith('.json')),
+                        key=lambda e: e.name
+                    )
+                for entry in entries:
+                    filename = entry.name
+                    try:
+                        st = entry.stat()
+                        key = (st.st_mtime_ns, st.st_size)
+                        cached = previous.get(filename)
+                        if cached and cached[:2] == key:
+                            session_name = cached[2]
+                        else:
+                            data = _load_session_file(entry.path, *key)
+                            session_name = data.get("session_name", filename[:-5])
+                        name_cache[filename] = key + (session_name,)
+                    except Exception as e:
+                        log.error(f"Failed to load session '{filename}': {e}")
+                        session_name = filename[:-5]
+                    results.append((filename, session_name))
+                    
+                # Persist the index only when something was added, changed or removed
+                if name_cache != previous:
+                    self.session_manager.save_available_index(name_cache)
         except Exception as e:
-            self.logger.error(f"Failed to refresh sessions: {e}")
+            log.error(f"Failed to refresh sessions: {e}")
+            dir_mtime = None
+            
+        self._ui.post(self._populate_listbox, generation, results, name_cache, dir_mtime)
+        
+    def _populate_listbox(self, generation, results, name_cache, dir_mtime):
+        """
+        Show session names in the listbox, but keep a mapping to filenames for selection.
+        Results from a scan superseded by a newer refresh are ignored.
+        """
+        if generation != self._scan_generation:
+            return
+            
+        # Only now is the list known to match this mtime; until then refreshes still scan
+        self._last_refresh_mtime_ns = dir_mtime
+        
+        # Rebuilt from the current listing, so entries for removed files are dropped
+        self._session_name_cache = name_cache
+        
+        # Only rows after the first difference are replaced; usually that is one row or none
+        old_items = self._listbox_items
+        prefix = 0
+        for old, new in zip(old_items, results):
+            if old != new:
+                break
+            prefix += 1
+        if prefix == len(old_items) == len(results):
+            return
+            
+        if self._last_loaded_idx is not None and self._last_loaded_idx >= prefix:
+            self._last_loaded_idx = None
+        # One Tcl call each for the removed and the added rows
+        self.session_listbox.delete(prefix, tk.END)
+        self.session_listbox.insert(tk.END, *(session_name for _, session_name in results[prefix:]))
+        self._listbox_items = results
+        self.session_display_map = dict(enumerate(filename for filename, _ in results))  # Maps listbox index to filename
 
     def on_session_select(self, event):
         """
         Handle session selection.
-        Use the filename mapped from the selected index.
+        Loading waits until the selection has been still for 150ms, so holding an arrow
+        key through the list only loads the session it stops on.
         """
+        self._cancel_pending_select()
+        self._select_after_id = self.parent.after(150, self._do_load_selected)
+        
+    def _cancel_pending_select(self):
+        """Drop a debounced selection load that has not run yet."""
+        if self._select_after_id:
+            self.parent.after_cancel(self._select_after_id)
+            self._select_after_id = None
+            
+    def _do_load_selected(self):
+        """Load the session selected now, using the filename mapped from its index."""
+        self._select_after_id = None
         selection = self.session_listbox.curselection()
         if selection:
             idx = selection[0]
             filename = self.session_display_map.get(idx)
             if filename:
-                self.load_session_data(filename)
+                self._ensure_editor_built()
+                self._last_loaded_idx = idx
+                self._ui.submit(self._io_pool, self._read_session, idx, filename)
+                
+    def _read_session(self, idx, filename):
+        """Read a session for the editor (runs on the I/O worker pool)."""
+        error = None
+        session_data = None
+        try:
+            filepath = os.path.join("Sessions/Available", filename)
+            try:
+                st = os.stat(filepath)
+            except OSError:
+                # Moved since the list was built; let the session manager search the other folders
+                session_data = self.session_manager.load_session(filename)
+            else:
+                session_data = _load_session_file(filepath, st.st_mtime_ns, st.st_size)
+        except Exception as e:
+            error = e
+        self._ui.post(self._finish_read_session, idx, session_data, error)
+        
+    def _finish_read_session(self, idx, session_data, error=None):
+        """Show a read session in the editor, unless another one was selected meanwhile."""
+        if idx != self._last_loaded_idx:
+            return
+        if error is not None:
+            self._last_loaded_idx = None
+            self.show_status(f"Failed to load session: {error}", error=True)
+        elif session_data:
+            # Re-clicking the loaded session only refills the form when the file changed on
+            # disk (the parse cache hands back the same dict while it has not) or was edited
+            loaded = self._current_loaded
+            if loaded and loaded[1] is session_data and self._loaded_form == self._snapshot_form():
+                return
+            self.load_session_data(session_data)
+            self._current_loaded = (session_data.get("session_name"), session_data, self.session_display_map.get(idx))
+            self._loaded_form = self._snapshot_form()
+            
+    def _snapshot_form(self):
+        """Return the editor's current contents, for comparing against a later snapshot."""
+        return self._get_form_values(), self.description_text.get("1.0", "end-1c")
             
     def new_session(self):
         """Create a new session."""
+        self._ensure_editor_built()
+        self._cancel_pending_select()
+        self._last_loaded_idx = None
+        self._current_loaded = None
         self.clear_form()
-        self.session_name_var.set(f"Session_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.session_name_var.set(_NOW().strftime(_FMT_ID))
         # Load default values from settings
         self.load_default_values()
         
@@ -622,7 +972,7 @@ class SessionsTab:
             self.focus_timeout_var.set(str(focus_timeout))
             
         except Exception as e:
-            self.logger.warning(f"Failed to load default values: {e}")
+            log.warning(f"Failed to load default values: {e}")
             # If loading defaults fails, use hardcoded fallbacks
             self.frame_count_var.set("50")
             self.exposure_var.set("30")
@@ -633,32 +983,35 @@ class SessionsTab:
         
     def clear_form(self):
         """Clear all form fields and set to default values."""
-        # Clear basic info
-        self.session_name_var.set("")
-        self.target_name_var.set("")
-        self.start_time_var.set(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
         self.description_text.delete(1.0, tk.END)
-        
-        # Clear coordinates
-        self.ra_var.set("")
-        self.dec_var.set("")
-        
-        # Set capture settings to defaults (will be overridden by load_default_values if called)
-        self.frame_count_var.set("50")
-        self.exposure_var.set("30")
-        self.gain_var.set("60")
-        self.binning_var.set("1x1")
-        self.filter_var.set("Astro")
-        
-        # Set calibration settings to defaults (will be overridden by load_default_values if called)
-        self.auto_focus_var.set(True)
-        self.plate_solve_var.set(True)
-        self.auto_guide_var.set(False)
-        self.settling_time_var.set("10")
-        self.focus_timeout_var.set("300")
+        self._set_vars_if_changed((
+            # Clear basic info
+            (self.session_name_var, ""),
+            (self.target_name_var, ""),
+            (self.start_time_var, _NOW().strftime(_FMT_HUMAN)),
+            # Clear coordinates
+            (self.ra_var, ""),
+            (self.dec_var, ""),
+            # Set capture settings to defaults (will be overridden by load_default_values if called)
+            (self.frame_count_var, "50"),
+            (self.exposure_var, "30"),
+            (self.gain_var, "60"),
+            (self.binning_var, "1x1"),
+            (self.filter_var, "Astro"),
+            # Set calibration settings to defaults (will be overridden by load_default_values if called)
+            (self.auto_focus_var, True),
+            (self.plate_solve_var, True),
+            (self.auto_guide_var, False),
+            (self.settling_time_var, "10"),
+            (self.focus_timeout_var, "300"),
+        ))
         
     def save_session(self):
         """Save current session with validation."""
+        if not self._check_io_idle():
+            return
+        self._ensure_editor_built()
+        self._flush_coordinate_conversions()
         if not self.session_name_var.get():
             messagebox.showerror("Error", "Session name is required!")
             return
@@ -671,85 +1024,207 @@ class SessionsTab:
             messagebox.showerror("Validation Error", validation_message)
             return
         
+        self._set_io_busy(True)
+        self._ui.submit(self._io_pool, self._do_save, session_data)
+        
+    def _do_save(self, session_data):
+        """Save a new Available session (runs on the I/O worker pool)."""
+        error = None
         try:
-            self.session_manager.save_session(session_data)
-            self.refresh_sessions()
-            messagebox.showinfo("Success", "Session saved successfully!")
+            index_mtime = self._available_index_mtime()
+            filepath = self.session_manager.save_session(session_data)
+            self._update_available_index(index_mtime, added=(session_data["session_name"], os.path.basename(filepath)))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to save session: {e}")
+            error = e
+        self._ui.post(self._finish_io, "Failed to save session", error, "Session saved successfully!")
+        
+    def _set_io_busy(self, busy):
+        """Disable or re-enable the buttons and menu entries that write session files."""
+        self._io_busy = busy
+        state = "disabled" if busy else "normal"
+        for button in self._io_buttons:
+            button.configure(state=state)
+        for label in ("Duplicate", "Delete", "Add to Schedule"):
+            self.context_menu.entryconfigure(label, state=state)
+            
+    def _check_io_idle(self):
+        """Return True if no session file operation is running; otherwise say so and return False."""
+        if self._io_busy:
+            self.show_status("Another session operation is still running; try again", error=True)
+            return False
+        return True
             
+    def _finish_io(self, failure_message, error=None, success_message=None):
+        """Report a background session file operation and re-enable the buttons (Tk thread)."""
+        self._set_io_busy(False)
+        self.refresh_sessions()
+        if error is not None:
+            self.show_status(f"{failure_message}: {error}", error=True)
+        elif success_message:
+            self.show_status(success_message)
+            
+    def show_status(self, message, duration_ms=3000, error=False, action=None):
+        """
+        Show a transient message in the inline status line (errors in red, for longer).
+        action is an optional (label, callback) pair offered as a button beside the message.
+        """
+        if self._status_clear_id is not None:
+            self.parent.after_cancel(self._status_clear_id)
+        self._status_label.configure(foreground="red" if error else "")
+        self.status_var.set(message)
+        if action is not None:
+            label, callback = action
+            self._status_action.configure(text=label, command=lambda: self._run_status_action(callback))
+            self._status_action.pack(side=tk.RIGHT)
+        else:
+            self._status_action.pack_forget()
+        self._status_clear_id = self.parent.after(duration_ms * 2 if error else duration_ms, self._clear_status)
+        
+    def _run_status_action(self, callback):
+        """Clear the status line and run the action its button offered."""
+        if self._status_clear_id is not None:
+            self.parent.after_cancel(self._status_clear_id)
+        self._clear_status()
+        callback()
+        
+    def _clear_status(self):
+        """Clear the inline status line."""
+        self._status_clear_id = None
+        self.status_var.set("")
+        self._status_action.pack_forget()
+        
+    def _confirm(self, title, message, on_yes):
+        """
+        Ask a yes/no question in a small non-modal window and call on_yes if confirmed.
+        Unlike messagebox, this does not grab input or run a nested event loop, so
+        background session operations keep reporting while it is open. While a dialog
+        is open, further requests just raise it.
+        """
+        if self._confirm_dialog is not None:
+            self._confirm_dialog.lift()
+            self._confirm_dialog.focus_set()
+            return
+            
+        dialog = tk.Toplevel(self.frame)
+        self._confirm_dialog = dialog
+        dialog.title(title)
+        dialog.transient(self.frame.winfo_toplevel())
+        dialog.resizable(False, False)
+        
+        ttk.Label(dialog, text=message, wraplength=350, justify=tk.LEFT).pack(padx=20, pady=(20, 10))
+        
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(pady=(0, 15))
+        
+        def close():
+            self._confirm_dialog = None
+            dialog.destroy()
+            
+        def yes():
+            close()
+            on_yes()
+            
+        yes_button = ttk.Button(button_frame, text="Yes", command=yes, default="active")
+        yes_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="No", command=close).pack(side=tk.LEFT, padx=5)
+        dialog.bind("<Return>", lambda e: yes())
+        dialog.bind("<Escape>", lambda e: close())
+        dialog.protocol("WM_DELETE_WINDOW", close)
+        yes_button.focus_set()
+            
+    def _get_form_values(self) -> Dict[str, Any]:
+        """Read every editor variable in a single Tcl call (booleans as bool, the rest as str)."""
+        names, tcl_names, is_bool = self._form_read_spec
+        if len(names) != len(self._form_vars):
+            # Sections are built lazily, so refresh the spec when variables were added
+            names = tuple(self._form_vars)
+            tcl_names = tuple(str(self._form_vars[n]) for n in names)
+            is_bool = tuple(isinstance(self._form_vars[n], tk.BooleanVar) for n in names)
+            self._form_read_spec = (names, tcl_names, is_bool)
+            
+        raw = self.parent.tk.call('apply', _GET_VALUES_SCRIPT, *tcl_names)
+        getboolean = self.parent.tk.getboolean
+        return {
+            name: getboolean(value) if boolean else str(value)
+            for name, value, boolean in zip(names, raw, is_bool)
+        }
+        
     def get_session_data(self) -> dict:
         """Get current form data as session dictionary."""
+        values = self._get_form_values()
         return {
-            "session_name": self.session_name_var.get(),
-            "target_name": self.target_name_var.get(),
-            "start_time": self.start_time_var.get(),
-            "description": self.description_text.get(1.0, tk.END).strip(),
+            "session_name": values["session_name_var"],
+            "target_name": values["target_name_var"],
+            "start_time": values["start_time_var"],
+            "description": self.description_text.get(1.0, 'end-1c').strip(),
             "coordinates": {
-                "ra": self.ra_var.get(),
-                "dec": self.dec_var.get(),
-                "ra_decimal": getattr(self, 'ra_decimal', 0.0),
-                "dec_decimal": getattr(self, 'dec_decimal', 0.0)
+                "ra": values["ra_var"],
+                "dec": values["dec_var"],
+                "ra_decimal": self.ra_decimal,
+                "dec_decimal": self.dec_decimal
             },
             "capture_settings": {
-                "frame_count": int(float(self.frame_count_var.get() or 0)),
-                "exposure_time": int(float(self.exposure_var.get() or 0)),
-                "gain": int(float(self.gain_var.get() or 0)),
-                "binning": self.binning_var.get(),
-                "filter": self.filter_options.get(self.filter_var.get(), 0)  # Store as int
+                "frame_count": int(float(values["frame_count_var"] or 0)),
+                "exposure_time": int(float(values["exposure_var"] or 0)),
+                "gain": int(float(values["gain_var"] or 0)),
+                "binning": values["binning_var"],
+                "filter": self.filter_options.get(values["filter_var"], 0)  # Store as int
             },
             "calibration": {
-                "auto_focus": self.auto_focus_var.get(),
-                "plate_solve": self.plate_solve_var.get(),
-                "auto_guide": self.auto_guide_var.get(),
-                "settling_time": int(float(self.settling_time_var.get() or 0)),
-                "focus_timeout": int(float(self.focus_timeout_var.get() or 0))
+                "auto_focus": values["auto_focus_var"],
+                "plate_solve": values["plate_solve_var"],
+                "auto_guide": values["auto_guide_var"],
+                "settling_time": int(float(values["settling_time_var"] or 0)),
+                "focus_timeout": int(float(values["focus_timeout_var"] or 0))
             }
         }
         
-    def load_session_data(self, session_name):
+    def _set_vars_if_changed(self, pairs):
+        """Set each (Tk variable, value) pair whose value differs, in a single Tcl call."""
+        args = []
+        for var, value in pairs:
+            args.append(str(var))
+            args.append(int(bool(value)) if isinstance(var, tk.BooleanVar) else str(value))
+        self.parent.tk.call('apply', _SET_CHANGED_SCRIPT, *args)
+            
+    def load_session_data(self, session_data):
         """Load session data into form."""
+        self._current_loaded = None
         try:
-            session_data = self.session_manager.load_session(session_name)
             if session_data:
-                self.session_name_var.set(session_data.get("session_name", ""))
-                self.target_name_var.set(session_data.get("target_name", ""))
-                self.start_time_var.set(session_data.get("start_time", ""))
-                self.description_text.delete(1.0, tk.END)
-                self.description_text.insert(1.0, session_data.get("description", ""))
+                description = session_data.get("description", "")
+                if self.description_text.get(1.0, 'end-1c') != description:
+                    self.description_text.delete(1.0, tk.END)
+                    self.description_text.insert(1.0, description)
                 
                 coords = session_data.get("coordinates", {})
-                
-                # Load coordinates using raw string values, not converted
-                # Store decimal values for calculations but display raw input
-                if "ra_decimal" in coords and coords["ra_decimal"]:
-                    self.ra_decimal = coords["ra_decimal"]
-                else:
-                    self.ra_decimal = None
-                self.ra_var.set(coords.get("ra", ""))
-                    
-                if "dec_decimal" in coords and coords["dec_decimal"]:
-                    self.dec_decimal = coords["dec_decimal"] 
-                else:
-                    self.dec_decimal = None
-                self.dec_var.set(coords.get("dec", ""))
-                
                 capture = session_data.get("capture_settings", {})
-                self.frame_count_var.set(str(capture.get("frame_count", 50)))
-                self.exposure_var.set(str(capture.get("exposure_time", 30)))
-                self.gain_var.set(str(capture.get("gain", 100)))
-                self.binning_var.set(capture.get("binning", "1x1"))
+                calib = session_data.get("calibration", {})
                 
-                # Set filter by value
-                value_to_name = {v: k for k, v in self.filter_options.items()}
-                self.filter_var.set(value_to_name.get(capture.get("filter", 0), "Vis"))
+                # Store decimal values for calculations but display raw input
+                # (0.0 is a valid coordinate, so only a missing value becomes None)
+                self.ra_decimal = coords.get("ra_decimal")
+                self.dec_decimal = coords.get("dec_decimal")
                 
-                calib = session_data.get("calibration", {})
-                self.auto_focus_var.set(calib.get("auto_focus", True))
-                self.plate_solve_var.set(calib.get("plate_solve", True))
-                self.auto_guide_var.set(calib.get("auto_guide", False))
-                self.settling_time_var.set(str(calib.get("settling_time", 10)))
-                self.focus_timeout_var.set(str(calib.get("focus_timeout", 300)))
+                self._set_vars_if_changed((
+                    (self.session_name_var, session_data.get("session_name", "")),
+                    (self.target_name_var, session_data.get("target_name", "")),
+                    (self.start_time_var, session_data.get("start_time", "")),
+                    # Load coordinates using raw string values, not converted
+                    (self.ra_var, coords.get("ra", "")),
+                    (self.dec_var, coords.get("dec", "")),
+                    (self.frame_count_var, capture.get("frame_count", 50)),
+                    (self.exposure_var, capture.get("exposure_time", 30)),
+                    (self.gain_var, capture.get("gain", 100)),
+                    (self.binning_var, capture.get("binning", "1x1")),
+                    # Set filter by value
+                    (self.filter_var, self._filter_value_to_name.get(capture.get("filter", 0), "Vis")),
+                    (self.auto_focus_var, calib.get("auto_focus", True)),
+                    (self.plate_solve_var, calib.get("plate_solve", True)),
+                    (self.auto_guide_var, calib.get("auto_guide", False)),
+                    (self.settling_time_var, calib.get("settling_time", 10)),
+                    (self.focus_timeout_var, calib.get("focus_timeout", 300)),
+                ))
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load session: {e}")
@@ -763,49 +1238,93 @@ class SessionsTab:
         )
         if filename:
             try:
-                with open(filename, 'r') as f:
-                    session_data = json.load(f)
-                    # Load data into form (implementation similar to load_session_data)
+                # Memoised per (path, mtime_ns, size), so reopening an unchanged file skips the parse
+                session_data = _load_session_path(filename)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load session file: {e}")
+                return
+                
+            # The form no longer shows the listbox selection
+            self._ensure_editor_built()
+            self._cancel_pending_select()
+            self._last_loaded_idx = None
+            self.session_listbox.selection_clear(0, tk.END)
+            self.load_session_data(session_data)
                 
     def delete_session(self):
         """Delete selected session."""
+        if not self._check_io_idle():
+            return
         selection = self.session_listbox.curselection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a session to delete.")
             return
             
         session_name = self.session_listbox.get(selection[0])
-        if messagebox.askyesno("Confirm Delete", f"Delete session '{session_name}'?"):
-            try:
-                self.session_manager.delete_session(session_name)
-                self.refresh_sessions()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to delete session: {e}")
+        filename = self.session_display_map.get(selection[0])
+        
+        def delete():
+            # The dialog is non-modal, so another operation may have started meanwhile
+            if not self._check_io_idle():
+                return
+            self._set_io_busy(True)
+            self._ui.submit(self._io_pool, self._do_delete, filename)
+            
+        self._confirm("Confirm Delete", f"Delete session '{session_name}'?", delete)
+            
+    def _do_delete(self, filename):
+        """Delete an Available session file (runs on the I/O worker pool)."""
+        error = None
+        try:
+            index_mtime = self._available_index_mtime()
+            # The listbox shows session names; the file is looked up by its real filename
+            if self.session_manager.delete_session(filename):
+                self._update_available_index(index_mtime, removed=filename)
+        except Exception as e:
+            error = e
+        self._ui.post(self._finish_io, "Failed to delete session", error)
                 
     def duplicate_session(self):
         """Duplicate selected session."""
+        if not self._check_io_idle():
+            return
         selection = self.session_listbox.curselection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a session to duplicate.")
             return
             
         session_name = self.session_listbox.get(selection[0])
+        filename = self.session_display_map.get(selection[0])
         new_name = f"{session_name}_copy"
         
+        self._set_io_busy(True)
+        self._ui.submit(self._io_pool, self._do_duplicate, filename, new_name)
+        
+    def _do_duplicate(self, filename, new_name):
+        """Copy an Available session under a new name (runs on the I/O worker pool)."""
+        error = None
         try:
-            self.session_manager.duplicate_session(session_name, new_name)
-            self.refresh_sessions()
+            index_mtime = self._available_index_mtime()
+            filepath = self.session_manager.duplicate_session(filename, new_name)
+            if filepath:
+                self._update_available_index(index_mtime, added=(new_name, os.path.basename(filepath)))
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to duplicate session: {e}")
+            error = e
+        self._ui.post(self._finish_io, "Failed to duplicate session", error)
             
     def edit_session(self):
         """Edit selected session (same as selection)."""
-        self.on_session_select(None)
+        # Always reload, discarding any unsaved edits to the form
+        self._cancel_pending_select()
+        self._last_loaded_idx = None
+        self._do_load_selected()
         
     def add_to_schedule(self):
         """Add current session to schedule with validation."""
+        if not self._check_io_idle():
+            return
+        self._ensure_editor_built()
+        self._flush_coordinate_conversions()
         if not self.session_name_var.get():
             messagebox.showerror("Error", "Please create or select a session first!")
             return
@@ -818,48 +1337,217 @@ class SessionsTab:
             messagebox.showerror("Validation Error", validation_message)
             return
         
+        # Look for an existing copy in Available and schedule it off the Tk thread
+        session_name = session_data.get('session_name', 'Unknown')
+        # The session loaded from the list already knows its file, unless it was renamed in the form
+        loaded_file = None
+        if self._current_loaded and self._current_loaded[0] == session_name:
+            loaded_file = self._current_loaded[2]
+        self._set_io_busy(True)
+        self._ui.submit(self._io_pool, self._do_add_to_schedule, session_name, session_data, loaded_file)
+        
+    def _do_add_to_schedule(self, session_name, session_data, loaded_file=None):
+        """Find the Available file for session_name and schedule it (runs on the I/O worker pool)."""
         try:
-            session_name = session_data.get('session_name', 'Unknown')
-            target_name = session_data.get('target_name', 'Unknown')
-            
-            # First, check if a session with this name/target already exists in Available
+            index_mtime = self._available_index_mtime()
             existing_file = None
-            available_dir = "Sessions/Available"
-            
-            if os.path.exists(available_dir):
-                for filename in os.listdir(available_dir):
-                    if filename.endswith('.json'):
-                        # Load the session to check if it matches
-                        existing_session = self.session_manager.load_session(filename, available_dir)
-                        if existing_session and (
-                            existing_session.get('session_name') == session_name or
-                            (existing_session.get('target_name') == target_name and 
-                             existing_session.get('session_name') == session_name)
-                        ):
-                            existing_file = filename
-                            break
-            
+            if loaded_file and os.path.isfile(os.path.join("Sessions/Available", loaded_file)):
+                existing_file = loaded_file
+            if existing_file is None:
+                # Check if a session with this name already exists in Available
+                existing_file = self._find_available_by_filename(session_name)
+            if existing_file is None:
+                # Fall back to the name index for files saved under another naming scheme
+                existing_file = self._get_available_index().get(session_name)
+        except Exception as e:
+            log.error(f"Failed to search Available sessions: {e}")
+            result = {"ok": False, "action": "search", "error": f"Failed to add to schedule: {e}"}
+        else:
+            result = self._schedule_session(existing_file, session_data)
+            if result["ok"] and existing_file:
+                self._update_available_index(index_mtime, removed=existing_file)
+                
+        self._ui.post(self._finish_add_to_schedule, result)
+        
+    def _schedule_session(self, existing_file, session_data):
+        """Move the existing session, or save a new one, into ToDo and return the outcome."""
+        action = "move" if existing_file else "save"
+        try:
             if existing_file:
                 # Move the existing session from Available to ToDo
-                success = self.session_manager.move_session(existing_file, "Available", "ToDo")
-                action = "moved to"
+                if not self.session_manager.move_session(existing_file, "Available", "ToDo"):
+                    return {"ok": False, "action": action, "error": "Failed to add session to schedule!"}
             else:
                 # No existing session found, save new one directly to ToDo
-                saved_filepath = self.session_manager.save_session(session_data, "ToDo")
-                success = True
-                action = "added to"
+                self.session_manager.save_session(session_data, status="ToDo")
+        except Exception as e:
+            return {"ok": False, "action": action, "error": f"Failed to add to schedule: {e}"}
+        return {"ok": True, "action": action, "error": None}
+        
+    def _finish_add_to_schedule(self, result):
+        """Report the outcome of Add to Schedule once, on the Tk thread."""
+        self._set_io_busy(False)
+        if result["ok"]:
+            # Refresh the sessions list to reflect the change
+            self.refresh_sessions()
+        else:
+            self.show_status(result["error"], error=True, action=("Retry", self.add_to_schedule))
             
-            if success:
-                # Refresh the sessions list to reflect the change
-                self.refresh_sessions()
-            else:
-                messagebox.showerror("Error", "Failed to add session to schedule!")
+    def _find_available_by_filename(self, session_name):
+        """
+        Find an Available session by its filename before parsing any JSON.
+        Sessions are saved as <timestamp>_<sanitized name>.json, so only files named
+        exactly that are opened. The session_name is still confirmed from the JSON,
+        because renaming a session in the editor keeps its original filename.
+        """
+        directory = "Sessions/Available"
+        sanitized = SessionManager.sanitize_session_name(session_name)
+        suffix = f"_{sanitized}.json"
+        # Rejects e.g. "..._X_M31.json" when looking for "M31", which the suffix alone matches
+        pattern = re.compile(rf"\d{{8}}_\d{{6}}_{re.escape(sanitized)}\.json")
+        try:
+            with os.scandir(directory) as it:
+                candidates = sorted(
+                    e.name for e in it
+                    if e.name.endswith(suffix) and pattern.fullmatch(e.name) and e.is_file()
+                )
+        except OSError:
+            return None
+            
+        for filename in candidates:
+            try:
+                filepath = os.path.join(directory, filename)
+                if _load_session_path(filepath).get('session_name') == session_name:
+                    return filename
+            except Exception as e:
+                log.error(f"Failed to load session '{filename}': {e}")
+        return None
+        
+    def _invalidate_available_index(self):
+        """Force the next _get_available_index call to rebuild the index."""
+        self._available_changes += 1
+        self._available_mtime = 0
+        
+    def _available_index_mtime(self):
+        """Return the Available directory mtime if the cached index still matches it, else 0."""
+        if not self._available_mtime:
+            return 0
+        try:
+            mtime = os.stat("Sessions/Available").st_mtime_ns
+        except OSError:
+            return 0
+        return mtime if mtime == self._available_mtime else 0
+        
+    def _update_available_index(self, index_mtime, added=None, removed=None):
+        """
+        Apply a change this tab made to Sessions/Available to the cached index, so the
+        next lookup does not rescan. index_mtime is _available_index_mtime() from before
+        the change; if the index was already stale it is simply invalidated.
+        added is a (session_name, filename) pair, removed a filename.
+        """
+        with self._available_lock:
+            if not index_mtime or index_mtime != self._available_mtime:
+                self._invalidate_available_index()
+                return
+            
+            index = dict(self._available_index)
+            files = dict(self._available_files)
+            if removed is not None and removed in files:
+                name = files.pop(removed)
+                if index.get(name) == removed:
+                    # Fall back to the next file with the same session_name, as a rebuild would
+                    others = [filename for filename, other in files.items() if other == name]
+                    if others:
+                        index[name] = min(others)
+                    else:
+                        del index[name]
+            if added is not None:
+                name, filename = added
+                files[filename] = name
+                if name not in index or filename < index[name]:
+                    index[name] = filename
                 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to add to schedule: {e}")
+            try:
+                mtime = os.stat("Sessions/Available").st_mtime_ns
+            except OSError:
+                self._invalidate_available_index()
+                return
+            self._available_index = index
+            self._available_files = files
+            self._available_mtime = mtime
+        
+    def _get_available_index(self):
+        """
+        Return {session_name: filename} for the Available sessions.
+        The index is only rebuilt when the directory's modification time changes,
+        or, when watchdog is available, when a change event has been seen.
+        Rebuilds and _update_available_index hold _available_lock, so concurrent
+        workers neither scan twice nor overwrite a newer index with a patched older one.
+        """
+        # With a filesystem watch, any change resets _available_mtime, so no stat is needed
+        if self._available_observer is not None and self._available_mtime:
+            return self._available_index
             
+        directory = "Sessions/Available"
+        with self._available_lock:
+            # Checked under the lock so a caller that waited on a rebuild reuses its result
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                return {}
+                
+            if mtime == self._available_mtime:
+                return self._available_index
+                
+            return self._rebuild_available_index(directory, mtime)
+            
+    def _rebuild_available_index(self, directory, mtime):
+        """Rescan the Available directory into the index; called with _available_lock held."""
+        changes = self._available_changes
+        index = {}
+        files = {}
+        with os.scandir(directory) as it:
+            entries = sorted(
+                (e for e in it if e.is_file() and e.name.endswith('.json')),
+                key=lambda e: e.name
+            )
+        # File reads overlap across the scan pool; results come back in name order
+        for entry, data in zip(entries, self._scan_pool.map(_load_session_entry, entries)):
+            if data is None:
+                continue
+            files[entry.name] = data.get('session_name')
+            index.setdefault(files[entry.name], entry.name)
+                
+        self._available_index = index
+        self._available_files = files
+        # A change seen while scanning leaves the index marked stale
+        self._available_mtime = mtime if changes == self._available_changes else 0
+        return index
+        
     def convert_ra_coordinate(self, event=None):
+        """Schedule RA conversion once input has been idle for 300ms."""
+        if self._ra_debounce_id:
+            self.parent.after_cancel(self._ra_debounce_id)
+        self._ra_debounce_id = self.parent.after(300, self._do_convert_ra)
+        
+    def convert_dec_coordinate(self, event=None):
+        """Schedule DEC conversion once input has been idle for 300ms."""
+        if self._dec_debounce_id:
+            self.parent.after_cancel(self._dec_debounce_id)
+        self._dec_debounce_id = self.parent.after(300, self._do_convert_dec)
+        
+    def _flush_coordinate_conversions(self):
+        """Run any pending RA/DEC conversion now, before the form is read."""
+        if self._ra_debounce_id:
+            self.parent.after_cancel(self._ra_debounce_id)
+            self._do_convert_ra()
+        if self._dec_debounce_id:
+            self.parent.after_cancel(self._dec_debounce_id)
+            self._do_convert_dec()
+            
+    def _do_convert_ra(self):
         """Convert RA coordinate input to standard format."""
+        self._ra_debounce_id = None
         try:
             input_value = self.ra_var.get().strip()
             if not input_value:
@@ -868,9 +1556,11 @@ class SessionsTab:
             # Parse the input and convert to decimal hours
             decimal_hours = parse_coordinate_input(input_value, "ra")
             
-            # Validate RA range (0-24 hours)
-            if decimal_hours < 0 or decimal_hours >= 24:
-                raise ValueError("RA must be between 0 and 24 hours")
+            # Validate RA range (0-24 hours); isfinite also rejects "nan"/"inf" input
+            if not (math.isfinite(decimal_hours) and 0.0 <= decimal_hours < 24.0):
+                messagebox.showerror("Invalid RA Format", "RA must be between 0 and 24 hours")
+                self.ra_entry.focus()
+                return
                 
             # Set as decimal value (J2000 format)
             self.ra_var.set(f"{decimal_hours:.6f}")
@@ -883,8 +1573,9 @@ class SessionsTab:
             messagebox.showerror("Invalid RA Format", str(e))
             self.ra_entry.focus()
             
-    def convert_dec_coordinate(self, event=None):
+    def _do_convert_dec(self):
         """Convert DEC coordinate input to standard format."""
+        self._dec_debounce_id = None
         try:
             input_value = self.dec_var.get().strip()
             if not input_value:
@@ -893,9 +1584,11 @@ class SessionsTab:
             # Parse the input and convert to decimal degrees
             decimal_degrees = parse_coordinate_input(input_value, "dec")
             
-            # Validate DEC range (-90 to +90 degrees)
-            if decimal_degrees < -90 or decimal_degrees > 90:
-                raise ValueError("DEC must be between -90 and +90 degrees")
+            # Validate DEC range (-90 to +90 degrees); isfinite also rejects "nan"/"inf" input
+            if not (math.isfinite(decimal_degrees) and -90.0 <= decimal_degrees <= 90.0):
+                messagebox.showerror("Invalid DEC Format", "DEC must be between -90 and +90 degrees")
+                self.dec_entry.focus()
+                return
                 
             # Set as decimal value (J2000 format)
             self.dec_var.set(f"{decimal_degrees:.6f}")
@@ -910,131 +1603,177 @@ class SessionsTab:
             
     def get_ra_decimal(self):
         """Get RA in decimal hours."""
-        return getattr(self, 'ra_decimal', 0.0)
+        return self.ra_decimal
         
     def get_dec_decimal(self):
         """Get DEC in decimal degrees."""
-        return getattr(self, 'dec_decimal', 0.0)
+        return self.dec_decimal
                 
     def get_from_stellarium(self):
         """Get current target and coordinates from Stellarium."""
-        def stellarium_worker():
-            """Worker function to fetch data from Stellarium in background thread."""
-            # Get Stellarium connection settings from CONFIG section (outside try block)
-            stellarium_ip = self.config_manager.get_setting("CONFIG", "stellarium_ip", "192.168.1.20")
-            stellarium_port = self.config_manager.get_setting("CONFIG", "stellarium_port", 8090)
+        # Run in the background worker to avoid blocking the GUI
+        done = threading.Event()
+        try:
+            self._stellarium_q.put_nowait(done)
+        except queue.Full:
+            return  # A request is already waiting; it will pick up the current selection
+        self._ui.hold_while(lambda: not done.is_set())
             
+    def _stellarium_loop(self):
+        """Serve Stellarium requests one at a time until cleanup() posts None."""
+        while (done := self._stellarium_q.get()) is not None:
             try:
-                # Build the API URL for getting object info
-                base_url = f"http://{stellarium_ip}:{stellarium_port}/api"
-                
-                # Try different endpoints and formats
-                endpoints_to_try = [
-                    f"{base_url}/objects/info?format=json",  # Explicitly request JSON format
-                    f"{base_url}/objects/info",               # Default endpoint
-                    f"{base_url}/stelaction/do",              # Alternative action endpoint
-                ]
-                
-                object_info = None
-                successful_endpoint = None
-                
-                for endpoint in endpoints_to_try:
-                    try:
-                        response = requests.get(endpoint, timeout=10)
-                        if response.status_code == 200:
-                            object_info = response.json()
-                            successful_endpoint = endpoint
-                            break
-                    except requests.exceptions.RequestException:
-                        continue
-                
-                # If no endpoint worked, show connection error
-                if object_info is None:
-                    self.parent.after(0, lambda: messagebox.showerror(
-                        "Connection Error",
-                        f"Cannot get TARGET from Stellarium at {stellarium_ip}:{stellarium_port}\n\n"
-                        f"Please ensure:\n"
-                        f"• A target is selected in Stellarium"
-                    ))
-                    return
+                self._fetch_from_stellarium()
+            finally:
+                done.set()
+            
+    def _fetch_from_stellarium(self):
+        """Fetch the selected object from Stellarium; runs on the worker thread."""
+        # Get Stellarium connection settings from CONFIG section (outside try block)
+        stellarium_ip = self.config_manager.get_setting("CONFIG", "stellarium_ip", "192.168.1.20")
+        stellarium_port = self.config_manager.get_setting("CONFIG", "stellarium_port", 8090)
+        
+        try:
+            # Build the API URL for getting object info
+            base_url = f"http://{stellarium_ip}:{stellarium_port}/api"
+            
+            # Try different endpoints and formats
+            endpoints_to_try = [
+                f"{base_url}/objects/info?format=json",  # Explicitly request JSON format
+                f"{base_url}/objects/info",               # Default endpoint
+                f"{base_url}/stelaction/do",              # Alternative action endpoint
+            ]
+            
+            # Try the endpoint that worked last time first (ignored if the IP/port changed)
+            cached_endpoint = self._stellarium_endpoint
+            if cached_endpoint in endpoints_to_try:
+                endpoints_to_try.remove(cached_endpoint)
+                endpoints_to_try.insert(0, cached_endpoint)
+            
+            object_info = None
+            successful_endpoint = None
+            
+            for endpoint in endpoints_to_try:
+                try:
+                    # Stellarium runs on the LAN, so a connect should take well under a
+                    # second; fail wrong hosts fast but allow a slower response
+                    response = self._http.get(endpoint, timeout=(2, 8))
+                    if response.status_code == 200:
+                        object_info = orjson.loads(response.content) if orjson else response.json()
+                        successful_endpoint = endpoint
+                        break
+                except (requests.exceptions.RequestException, ValueError):
+                    # ValueError covers a non-JSON body from either decoder
+                    continue
                     
-                if not object_info or "name" not in object_info:
-                    self.parent.after(0, lambda: messagebox.showwarning(
-                        "No Selection", 
-                        "No object is currently selected in Stellarium.\nPlease select an object first."
-                    ))
-                    return
+            # Remember the working endpoint, or forget it so the next request probes again
+            self._stellarium_endpoint = successful_endpoint
+            
+            # If no endpoint worked, show connection error
+            if object_info is None:
+                self._ui.post(lambda: messagebox.showerror(
+                    "Connection Error",
+                    f"Cannot get TARGET from Stellarium at {stellarium_ip}:{stellarium_port}\n\n"
+                    f"Please ensure:\n"
+                    f"• A target is selected in Stellarium"
+                ))
+                return
                 
-                # Get target name - try different possible fields
-                target_name = object_info.get("name", "Unknown")
-                if target_name == "Unknown" or not target_name:
-                    target_name = object_info.get("localized-name", "Unknown")
-                if target_name == "Unknown" or not target_name:
-                    target_name = object_info.get("designations", "Unknown")
+            if not object_info or "name" not in object_info:
+                self._ui.post(lambda: messagebox.showwarning(
+                    "No Selection", 
+                    "No object is currently selected in Stellarium.\nPlease select an object first."
+                ))
+                return
+            
+            # Get target name - try different possible fields
+            target_name = object_info.get("name", "Unknown")
+            if target_name == "Unknown" or not target_name:
+                target_name = object_info.get("localized-name", "Unknown")
+            if target_name == "Unknown" or not target_name:
+                target_name = object_info.get("designations", "Unknown")
 
-                target_desc = object_info.get("object-type", "") + "\n"
-                target_desc += object_info.get("type", "")
+            target_name = target_name.strip()
+            target_desc = f'{object_info.get("object-type", "")}\n{object_info.get("type", "")}'.strip()
 
-                target_name = target_name.strip()
-                target_desc = target_desc.strip()
+            # Get coordinates - Stellarium returns RA in degrees, need to convert to hours
+            ra_degrees = object_info.get("raJ2000", 0)  # RA in degrees from raJ2000
+            dec_decimal = object_info.get("decJ2000", 0)  # DEC in degrees from decJ2000
+            
+            # Validate coordinates
+            if ra_degrees == 0 and dec_decimal == 0:
+                self._ui.post(lambda: messagebox.showwarning(
+                    "Invalid Coordinates", 
+                    "Stellarium returned invalid coordinates (0,0).\nPlease ensure a valid astronomical object is selected."
+                ))
+                return
+            
+            # Convert RA from degrees to hours (divide by 15)
+            # Also normalize to 0-24 hours range
+            ra_decimal = ra_degrees / 15.0
+            
+            # Normalize RA to 0-24 hours range
+            ra_decimal = ra_decimal % 24.0
+            
+            # Update the GUI in the main thread
+            def update_gui():
+                self.target_name_var.set(target_name)
+                self.ra_var.set(f"{ra_decimal:.6f}")
+                self.dec_var.set(f"{dec_decimal:.6f}")
+                self.ra_decimal = ra_decimal
+                self.dec_decimal = dec_decimal
+                # Set the description field with target_desc from Stellarium
+                self.description_text.delete(1.0, tk.END)
+                self.description_text.insert(1.0, target_desc)
+                # Use logger instead of add_log_message (which does not exist)
+                log.info(f"Loaded from Stellarium: {target_name} at RA={ra_decimal:.6f}h, DEC={dec_decimal:.6f}°")
 
-                # Get coordinates - Stellarium returns RA in degrees, need to convert to hours
-                ra_degrees = object_info.get("raJ2000", 0)  # RA in degrees from raJ2000
-                dec_decimal = object_info.get("decJ2000", 0)  # DEC in degrees from decJ2000
-                
-                # Validate coordinates
-                if ra_degrees == 0 and dec_decimal == 0:
-                    self.parent.after(0, lambda: messagebox.showwarning(
-                        "Invalid Coordinates", 
-                        "Stellarium returned invalid coordinates (0,0).\nPlease ensure a valid astronomical object is selected."
-                    ))
-                    return
+            self._ui.post(update_gui)
                 
-                # Convert RA from degrees to hours (divide by 15)
-                # Also normalize to 0-24 hours range
-                ra_decimal = ra_degrees / 15.0
-                
-                # Normalize RA to 0-24 hours range
-                while ra_decimal < 0:
-                    ra_decimal += 24
-                while ra_decimal >= 24:
-                    ra_decimal -= 24
-                
-                # Update the GUI in the main thread
-                def update_gui():
-                    self.target_name_var.set(target_name)
-                    self.ra_var.set(f"{ra_decimal:.6f}")
-                    self.dec_var.set(f"{dec_decimal:.6f}")
-                    self.ra_decimal = ra_decimal
-                    self.dec_decimal = dec_decimal
-                    # Set the description field with target_desc from Stellarium
-                    self.description_text.delete(1.0, tk.END)
-                    self.description_text.insert(1.0, target_desc)
-                    # Use logger instead of add_log_message (which does not exist)
-                    self.logger.info(f"Loaded from Stellarium: {target_name} at RA={ra_decimal:.6f}h, DEC={dec_decimal:.6f}°")
-
-                self.parent.after(0, update_gui)
-                    
-            except requests.exceptions.ConnectionError:
-                error_msg = (f"Cannot connect to Stellarium at {stellarium_ip}:{stellarium_port}\n\n"
-                           f"Please ensure:\n"
-                           f"• Stellarium is running\n"
-                           f"• Remote Control plugin is enabled\n"
-                           f"• Server settings match: {stellarium_ip}:{stellarium_port}\n"
-                           f"• Check Settings tab for correct IP address")
-                self.parent.after(0, lambda: messagebox.showerror("Connection Error", error_msg))
-            except requests.exceptions.Timeout:
-                self.parent.after(0, lambda: messagebox.showerror(
-                    "Timeout Error", 
-                    "Connection to Stellarium timed out.\nPlease check if Stellarium is responding."
-                ))
-            except Exception as e:
-                error_msg = f"Failed to get data from Stellarium: {str(e)}"
-                self.parent.after(0, lambda: messagebox.showerror(
-                    "Error", 
-                    error_msg
-                ))
+        except requests.exceptions.ConnectionError:
+            error_msg = (f"Cannot connect to Stellarium at {stellarium_ip}:{stellarium_port}\n\n"
+                       f"Please ensure:\n"
+                       f"• Stellarium is running\n"
+                       f"• Remote Control plugin is enabled\n"
+                       f"• Server settings match: {stellarium_ip}:{stellarium_port}\n"
+                       f"• Check Settings tab for correct IP address")
+            self._ui.post(lambda: messagebox.showerror("Connection Error", error_msg))
+        except requests.exceptions.Timeout:
+            self._ui.post(lambda: messagebox.showerror(
+                "Timeout Error", 
+                "Connection to Stellarium timed out.\nPlease check if Stellarium is responding."
+            ))
+        except Exception as e:
+            error_msg = f"Failed to get data from Stellarium: {str(e)}"
+            self._ui.post(lambda: messagebox.showerror(
+                "Error", 
+                error_msg
+            ))
+        
+    def cleanup(self):
+        """Close the Stellarium HTTP session, the I/O worker pool and the Available directory watch."""
+        self._ui.close()
         
-        # Run in background thread to avoid blocking the GUI
-        thread = threading.Thread(target=stellarium_worker, daemon=True)
-        thread.start()
+        try:
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+            self._scan_pool.shutdown(wait=False, cancel_futures=True)
+        except Exception as e:
+            log.error(f"Error shutting down sessions I/O pools: {e}")
+            
+        try:
+            self._http.close()
+        except Exception as e:
+            log.error(f"Error closing Stellarium HTTP session: {e}")
+            
+        # Stop the Stellarium worker once it finishes any request in flight
+        try:
+            self._stellarium_q.put_nowait(None)
+        except queue.Full:
+            pass
+            
+        if self._available_observer is not None:
+            try:
+                self._available_observer.stop()
+                self._available_observer.join(timeout=1)
+            except Exception as e:
+                log.error(f"Error stopping Available directory watch: {e}")
@@ -0,0 +1,85 @@
+"""
+Hands results from worker threads back to the Tk thread.
+"""
+
+import logging
+import queue
+import threading
+
+log = logging.getLogger(__name__)
+
+
+class UIDispatcher:
+    """
+    Runs callbacks posted from any thread on the Tk thread.
+    Worker threads never call Tk themselves (after() from another thread fails before the
+    main loop starts); they post() into a queue that the Tk thread polls with after().
+    Polling only runs while work registered with submit(), start_thread() or hold_while()
+    is outstanding, or something is waiting in the queue.
+    """
+    
+    def __init__(self, widget, interval_ms=50):
+        self._widget = widget
+        self._interval_ms = interval_ms
+        self._queue = queue.Queue()
+        # Predicates that keep polling alive while they return True (Tk thread only)
+        self._holds = []
+        self._after_id = None
+        self._closed = False
+        
+    def post(self, callback, *args):
+        """Queue callback(*args) to run on the Tk thread; safe to call from any thread."""
+        self._queue.put((callback, args))
+        if threading.current_thread() is threading.main_thread():
+            self._schedule()
+            
+    def submit(self, executor, fn, *args):
+        """Run fn(*args) on executor, polling for its posted results until it finishes (Tk thread)."""
+        future = executor.submit(fn, *args)
+        self.hold_while(lambda: not future.done())
+        return future
+        
+    def start_thread(self, fn, *args):
+        """Run fn(*args) on a new daemon thread, polling until it exits (Tk thread)."""
+        thread = threading.Thread(target=fn, args=args, daemon=True)
+        thread.start()
+        self.hold_while(thread.is_alive)
+        return thread
+        
+    def hold_while(self, predicate):
+        """Keep polling while predicate() is true, e.g. while a long-lived worker is busy (Tk thread)."""
+        self._holds.append(predicate)
+        self._schedule()
+        
+    def close(self):
+        """Stop polling; anything still queued is dropped."""
+        self._closed = True
+        if self._after_id is not None:
+            try:
+                self._widget.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+            
+    def _schedule(self):
+        """Arm the next poll unless one is already pending (Tk thread)."""
+        if self._after_id is None and not self._closed:
+            self._after_id = self._widget.after(self._interval_ms, self._poll)
+            
+    def _poll(self):
+        """Run queued callbacks, and poll again only while work is outstanding."""
+        self._after_id = None
+        # Checked before draining: a worker posts before it finishes, so once its hold
+        # is released everything it posted is already in the queue
+        self._holds = [hold for hold in self._holds if hold()]
+        while True:
+            try:
+                callback, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                log.error(f"Error applying background result: {e}")
+        if self._holds or not self._queue.empty():
+            self._schedule()